@@ -0,0 +1,34 @@
+"""
+Entry point for `python -m guess_number_game`.
+
+Only the module of the selected tool is imported, so starting the game doesn't
+load the server, strategy or replay log code.
+
+Usage:
+    python -m guess_number_game [options] [--startup-profile]
+    python -m guess_number_game server [options]
+    python -m guess_number_game strategy [options]
+    python -m guess_number_game replay <log>
+"""
+
+import sys
+
+TOOLS = {
+    "server": "guess_number_game.game_server",
+    "strategy": "guess_number_game.guess_strategy",
+    "replay": "guess_number_game.replay_log",
+}
+
+if "--startup-profile" in sys.argv[1:]:
+    from startup_profile.startup_profile import profile_startup
+    sys.exit(profile_startup("guess_number_game", sys.argv[1:]))
+
+if len(sys.argv) > 1 and sys.argv[1] in TOOLS:
+    from importlib import import_module
+
+    tool = sys.argv.pop(1)
+    import_module(TOOLS[tool]).main()
+else:
+    from guess_number_game.guess_number_game import main
+
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+
+"""
+Guess the Number Game Server
+----------------------------
+This module hosts the guessing game for many concurrent players on a single asyncio
+event loop. Players connect through TCP or a Unix socket and play with a line based
+protocol: every line sent is a guess, and the server answers with the same messages
+as the terminal game. Sending 'quit' ends the session.
+
+Every session is a small object using __slots__ with a capped number of guesses,
+idle sessions are evicted after a timeout, and new players are refused once the
+server memory budget is reached.
+
+Usage:
+    python game_server.py --port 5000 --difficulty hard
+    python game_server.py --unix /tmp/guess_number_game.sock
+"""
+
+# --- Import python libraries
+
+import asyncio
+import argparse
+import random
+import sys
+import time
+from bisect import insort
+
+try:
+    from .guess_number_game import analyze_guess, difficulty_interval_map, draw_number, get_interval
+except ImportError:
+    from guess_number_game import analyze_guess, difficulty_interval_map, draw_number, get_interval
+
+# --- Useful global variables
+
+# Rough amount of memory used by one connected player, without its guesses: the
+# session object, the stream reader/writer pair and the task handling it.
+SESSION_MEMORY_ESTIMATE = 4096
+
+# Guesses allowed per session, raised to the bits of the range so a binary search always fits
+MAX_GUESSES = 64
+
+# Longest line accepted from a player, guesses are short so keep the read buffer small
+MAX_LINE_LENGTH = 1024
+
+# --- Class definitions
+
+
+class GameSession:
+    """
+    State of a single player's game.
+
+    Guesses outside the range aren't counted, and the game ends once max_guesses
+    guesses were made, so the memory used by a session is bounded.
+
+    Attributes:
+        number (int): The target number.
+        low (int): Lowest number allowed as a guess.
+        high (int): Highest number allowed as a guess.
+        max_guesses (int): Guesses allowed before the game ends.
+        tries (int): Number of valid guesses made so far.
+        tried_numbers (list): Sorted list of the guesses made so far.
+        last_active (float): Monotonic time of the player's last message.
+        writer (asyncio.StreamWriter): Stream used to answer the player.
+    """
+
+    __slots__ = ("number", "low", "high", "max_guesses", "tries", "tried_numbers", "last_active", "writer")
+
+    def __init__(self, number: int, writer: asyncio.StreamWriter, low: int, high: int,
+                 max_guesses: int = MAX_GUESSES):
+        self.number = number
+        self.low = low
+        self.high = high
+        self.max_guesses = max_guesses
+        self.tries = 0
+        self.tried_numbers = []
+        self.last_active = time.monotonic()
+        self.writer = writer
+
+    def play(self, line: str) -> tuple[list[str], bool]:
+        """
+        Process one line sent by the player.
+
+        Args:
+            line (str): The line received, without the line ending.
+
+        Returns:
+            tuple: (messages to send back, True if the game is over)
+        """
+        self.last_active = time.monotonic()
+
+        try:
+            guess = int(line)
+        except ValueError:
+            return ["Invalid input! Please enter an integer."], False
+
+        if not self.low <= guess <= self.high:
+            return [f"Please provide a number between {self.low} and {self.high}"], False
+
+        # Track all guesses in order
+        insort(self.tried_numbers, guess)
+
+        self.tries += 1
+
+        # Analyze guess and provide feedback
+        status = analyze_guess(guess, self.number)
+        messages = [f"The number is {status}",
+                    f"You have tried the following numbers: {self.tried_numbers}"]
+
+        if status == "correct":
+            messages.append(f"The game took {self.tries} tries.")
+            return messages, True
+
+        if self.tries >= self.max_guesses:
+            messages.append(f"Out of guesses, the number was {self.number}.")
+            return messages, True
+
+        return messages, False
+
+
+class GameServer:
+    """
+    Asyncio server running one game session per connected player.
+
+    Args:
+        difficulty (str): The difficulty level (default: 'normal').
+        low (int | None): Custom lower bound (default: difficulty lower bound).
+        high (int | None): Custom upper bound (default: difficulty upper bound).
+        seed (int | None): Seed to make the sequence of target numbers reproducible.
+        idle_timeout (float): Seconds without messages before a player is disconnected.
+        memory_budget (int): Approximate bytes the sessions are allowed to use, including their guesses.
+
+    Raises:
+        ValueError: If an invalid difficulty, range, timeout or memory budget is provided.
+    """
+
+    def __init__(self, difficulty: str = "normal", low: int | None = None, high: int | None = None,
+                 seed: int | None = None, idle_timeout: float = 300.0, memory_budget: int = 256 * 1024 * 1024):
+        if idle_timeout <= 0:
+            raise ValueError("The idle timeout must be greater than zero")
+
+        self.difficulty = difficulty
+        self.low, self.high = get_interval(difficulty, low, high)
+        self.max_guesses = max(MAX_GUESSES, (self.high - self.low).bit_length() + 1)
+
+        # Every guess is an int within the range plus its slot in the list of guesses
+        guess_size = sys.getsizeof(max(abs(self.low), abs(self.high))) + 8
+        self.session_memory = SESSION_MEMORY_ESTIMATE + self.max_guesses * guess_size
+        if memory_budget < self.session_memory:
+            raise ValueError(f"The memory budget must be at least {self.session_memory} bytes")
+
+        self.rng = random.Random(seed)
+        self.idle_timeout = idle_timeout
+        self.max_sessions = memory_budget // self.session_memory
+        self.sessions = set()
+        self.evicted = 0
+        self.rejected = 0
+        self._server = None
+        self._eviction_task = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 5000, unix_path: str | None = None) -> None:
+        """
+        Start listening for players and evicting idle sessions.
+
+        Args:
+            host (str): Address to listen on for TCP connections.
+            port (int): Port to listen on for TCP connections, 0 picks a free one.
+            unix_path (str | None): Listen on this Unix socket instead of TCP if provided.
+        """
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self.handle_player, unix_path, limit=MAX_LINE_LENGTH)
+        else:
+            self._server = await asyncio.start_server(self.handle_player, host, port, limit=MAX_LINE_LENGTH,
+                                                      backlog=4096)
+
+        self._eviction_task = asyncio.create_task(self.evict_idle_sessions())
+
+    @property
+    def sockets(self) -> tuple:
+        """Sockets the server is listening on."""
+        return self._server.sockets if self._server else ()
+
+    async def serve_forever(self) -> None:
+        """Serve players until the server is closed."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting players and disconnect all the running sessions."""
+        if self._eviction_task:
+            self._eviction_task.cancel()
+        if self._server:
+            self._server.close()
+
+        for session in list(self.sessions):
+            session.writer.close()
+
+        if self._server:
+            await self._server.wait_closed()
+
+    async def evict_idle_sessions(self) -> None:
+        """Periodically disconnect the players that have been idle for too long."""
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+
+            deadline = time.monotonic() - self.idle_timeout
+            for session in [session for session in self.sessions if session.last_active < deadline]:
+                # Closing the writer ends the player's pending read, which removes the session
+                session.writer.write(b"Disconnected for being idle.\n")
+                session.writer.close()
+                self.sessions.discard(session)
+                self.evicted += 1
+
+    async def handle_player(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Run the game for a single connected player.
+
+        Args:
+            reader (asyncio.StreamReader): Stream with the player's guesses.
+            writer (asyncio.StreamWriter): Stream used to answer the player.
+        """
+        if len(self.sessions) >= self.max_sessions:
+            self.rejected += 1
+            writer.write(b"Server is full, please try again later.\n")
+            writer.close()
+            return
+
+        session = GameSession(draw_number(self.rng, self.low, self.high), writer, self.low, self.high, self.max_guesses)
+        self.sessions.add(session)
+
+        writer.write(f"Selected difficulty is {self.difficulty}\n"
+                     f"Please provide a number between {self.low} and {self.high}\n".encode())
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                line = line.decode(errors="replace").strip()
+                if line == "quit":
+                    break
+
+                messages, game_over = session.play(line)
+                writer.write(("\n".join(messages) + "\n").encode())
+
+                if game_over:
+                    break
+
+                # Wait while the client isn't reading its answers, so they don't pile up in memory
+                await writer.drain()
+
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+
+
+# --- Method definitions
+
+def parse_arguments():
+    """
+    Parse command-line arguments for the game server.
+
+    Returns:
+        Namespace: Parsed arguments with the server and game settings.
+    """
+    parser = argparse.ArgumentParser(description="Guess the Number Game Server")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=5000, help="TCP port to listen on (default: 5000)")
+    parser.add_argument("--unix", default=None, help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument(
+        "-d", "--difficulty",
+        choices=list(difficulty_interval_map),
+        default="normal",
+        help="Set the game difficulty level (default: normal)"
+    )
+    parser.add_argument("--min", type=int, default=None, help="Custom lower bound for the target numbers")
+    parser.add_argument("--max", type=int, default=None, help="Custom upper bound for the target numbers")
+    parser.add_argument("--seed", type=int, default=None, help="Seed to get reproducible target numbers")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds without messages before a player is disconnected (default: 300)"
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=int,
+        default=256,
+        help="Approximate memory in MiB the sessions are allowed to use (default: 256)"
+    )
+    return parser.parse_args()
+
+async def run_server(args) -> None:
+    """
+    Create the game server from the parsed arguments and serve until interrupted.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+    """
+    server = GameServer(args.difficulty, args.min, args.max, args.seed,
+                        args.idle_timeout, args.memory_budget * 1024 * 1024)
+    await server.start(args.host, args.port, args.unix)
+
+    print(f"Serving the guessing game on {args.unix or f'{args.host}:{args.port}'} "
+          f"for up to {server.max_sessions} players")
+
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+def main() -> None:
+    """
+    Parse the command-line arguments and serve the game until interrupted.
+    """
+    try:
+        asyncio.run(run_server(parse_arguments()))
+    except ValueError as e:
+        print(f"Error starting the server:\n\t{e}")
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,20 @@ parsing command-line arguments, and running the game loop.
 # --- Import python libraries
 
 import random
-import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+if not __package__:
+    # Run as a script: the shared packages live one level up. Put the repository root
+    # right after the script directory so installed packages can't shadow them
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if repo_root not in sys.path:
+        sys.path.insert(1, repo_root)
+
+from output_writer.output_writer import OUTPUT_DEFAULTS, add_output_arguments, open_output
+from metrics.metrics import METRICS_DEFAULTS, NULL_METRICS, add_metrics_arguments, open_metrics
 
 # --- Useful global variables
 
@@ -21,49 +34,153 @@ difficulty_interval_map = {
         "hard"  : (0, 100)
     }
 
+# Values of the options when they aren't given, also used as the build_parser defaults
+DEFAULT_OPTIONS = {
+    "difficulty": "normal",
+    "min": None,
+    "max": None,
+    "seed": None,
+    "hints": None,
+    "replay_log": None,
+    **OUTPUT_DEFAULTS,
+    **METRICS_DEFAULTS,
+}
+
+# Metrics of the games played, labelled with the difficulty
+GAMES_TOTAL = "guess_number_game_games_total"
+INVALID_INPUTS_TOTAL = "guess_number_game_invalid_inputs_total"
+GUESSES_PER_GAME = "guess_number_game_guesses_per_game"
+GUESS_SECONDS = "guess_number_game_guess_seconds"
+GAME_SECONDS = "guess_number_game_game_seconds"
+
+# Upper bounds of the histogram buckets for the tries per game
+TRIES_BUCKETS = (1, 2, 3, 4, 5, 6, 7, 8, 10, 12, 15, 20, 30, 50, 100)
+
 # --- Method definitons
 
 
-def generate_random_number(difficulty: str) -> int:
+def get_interval(difficulty: str, low: int | None = None, high: int | None = None) -> tuple[int, int]:
+    """
+    Get the guessing interval for a difficulty level, optionally overridden by custom bounds.
+
+    Args:
+        difficulty (str): The difficulty level ('easy', 'normal', 'hard').
+        low (int | None): Custom lower bound, replaces the difficulty lower bound if provided.
+        high (int | None): Custom upper bound, replaces the difficulty upper bound if provided.
+
+    Returns:
+        tuple[int, int]: (low, high) interval, both ends included.
+
+    Raises:
+        ValueError: If an invalid difficulty is provided or low is greater than high.
+    """
+    if difficulty not in difficulty_interval_map:
+        raise ValueError("Invalid difficulty provided. Please choose: 'easy', 'normal', or 'hard'")
+
+    default_low, default_high = difficulty_interval_map[difficulty]
+    low = default_low if low is None else low
+    high = default_high if high is None else high
+
+    if low > high:
+        raise ValueError(f"Invalid range provided: minimum {low} is greater than maximum {high}")
+
+    return low, high
+
+def generate_random_number(difficulty: str, low: int | None = None, high: int | None = None,
+                           rng: random.Random | None = None) -> int:
     """
-    Generate a random number based on the difficulty level.
+    Generate a random number based on the difficulty level or a custom range.
 
     Args:
         difficulty (str): The difficulty level ('easy', 'normal', 'hard').
+        low (int | None): Custom lower bound (default: difficulty lower bound).
+        high (int | None): Custom upper bound (default: difficulty upper bound).
+        rng (random.Random | None): Random generator to use, e.g. a seeded one (default: module random).
 
     Returns:
-        int: Random number within the difficulty interval.
+        int: Random number within the interval. Ranges can be arbitrarily large.
 
     Raises:
-        ValueError: If an invalid difficulty is provided.
+        ValueError: If an invalid difficulty or range is provided.
+    """
+    low, high = get_interval(difficulty, low, high)
+    return draw_number(rng or random, low, high)
+
+def draw_number(rng, low: int, high: int) -> int:
     """
-    match difficulty:
-        case "easy":
-            return random.randint(0, 10)
-        case "normal":
-            return random.randint(0, 50)
-        case "hard":
-            return random.randint(0, 100)
-        case _:
-            raise ValueError("Invalid difficulty provided. Please choose: 'easy', 'normal', or 'hard'")
+    Draw a number within an interval.
+
+    This is the only sampling routine of the game, the server and the batches, so the
+    same seed gives the same targets everywhere.
+
+    Args:
+        rng (random.Random): Random generator to draw from (or the random module).
+        low (int): Lower bound, included.
+        high (int): Upper bound, included.
 
-def get_user_int_input(difficulty: str) -> int:
+    Returns:
+        int: Random number within the interval.
+    """
+    return low + rng.randrange(high - low + 1)
+
+def generate_random_numbers(count: int, difficulty: str = "normal", low: int | None = None,
+                            high: int | None = None, seed: int | None = None,
+                            use_numpy: bool = False) -> list[int]:
+    """
+    Pre-generate target numbers for many game sessions at once.
+
+    The pure Python backend draws with draw_number from random.Random(seed), so it
+    works for ranges of any size and gives the same targets as the game and the server
+    started with the same seed. The NumPy backend is faster for large batches but only
+    supports ranges that fit in 64-bit integers, and its numbers differ.
+
+    Args:
+        count (int): How many numbers to generate.
+        difficulty (str): The difficulty level (default: 'normal').
+        low (int | None): Custom lower bound (default: difficulty lower bound).
+        high (int | None): Custom upper bound (default: difficulty upper bound).
+        seed (int | None): Seed to make the generated numbers reproducible.
+        use_numpy (bool): Use NumPy's random generator instead of the random module.
+
+    Returns:
+        list[int]: Random numbers within the interval.
+
+    Raises:
+        ValueError: If an invalid difficulty, range or count is provided.
+    """
+    if count < 0:
+        raise ValueError("The amount of numbers to generate can't be negative")
+
+    low, high = get_interval(difficulty, low, high)
+
+    if use_numpy:
+        import numpy as np
+
+        if low < -2**63 or high > 2**63 - 1:
+            raise ValueError("The NumPy backend only supports ranges within 64-bit integers")
+
+        generator = np.random.default_rng(seed)
+        return generator.integers(low, high, size=count, dtype=np.int64, endpoint=True).tolist()
+
+    rng = random.Random(seed)
+    return [draw_number(rng, low, high) for _ in range(count)]
+
+def get_user_int_input(difficulty: str, low: int | None = None, high: int | None = None) -> int:
     """
     Prompt the user for an integer input within the difficulty interval.
 
     Args:
         difficulty (str): The difficulty level.
+        low (int | None): Custom lower bound (default: difficulty lower bound).
+        high (int | None): Custom upper bound (default: difficulty upper bound).
 
     Returns:
         int: The user's valid integer input.
 
     Raises:
-        ValueError: If an invalid difficulty is provided.
+        ValueError: If an invalid difficulty or range is provided.
     """
-    if difficulty not in difficulty_interval_map:
-        raise ValueError("Invalid difficulty level")
-
-    low, high = difficulty_interval_map[difficulty]
+    low, high = get_interval(difficulty, low, high)
 
     while True:
         try:
@@ -95,23 +212,90 @@ def analyze_guess(guess: int, number: int) -> str:
     else:
         return "correct"
 
-def parse_arguments():
+def build_parser():
     """
-    Parse command-line arguments for the game.
+    Build the command-line parser for the game.
 
     Returns:
-        Namespace: Parsed arguments with difficulty setting.
+        ArgumentParser: Parser for the difficulty, custom range, seed and output settings.
     """
+    import argparse
+    from startup_profile.startup_profile import add_startup_profile_argument
+
     parser = argparse.ArgumentParser(description="Guess the Number Game")
     parser.add_argument(
         "-d", "--difficulty",
-        choices=["easy", "normal", "hard"],
-        default="normal",
-        help="Set the game difficulty level (default: normal)"
+        choices=list(difficulty_interval_map),
+        help="Set the game difficulty level (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--min",
+        type=int,
+        help="Custom lower bound, overrides the difficulty lower bound"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--max",
+        type=int,
+        help="Custom upper bound, overrides the difficulty upper bound (can be as large as you want)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for the random generator to get reproducible target numbers"
+    )
+    parser.add_argument(
+        "--hints",
+        choices=["minimax", "expected"],
+        help="Show the optimal next guess before each try, following the chosen strategy"
+    )
+    parser.add_argument(
+        "--replay-log",
+        help="Append every guess to this binary replay log"
+    )
+    add_output_arguments(parser)
+    add_metrics_arguments(parser)
+    add_startup_profile_argument(parser)
+    parser.set_defaults(**DEFAULT_OPTIONS)
+    return parser
 
-def run_game(difficulty_setting: str, input_func=input, output_func=print):
+def parse_arguments():
+    """
+    Parse command-line arguments for the game.
+
+    Without arguments, or with only a difficulty like `-d easy`, the options are set
+    without importing argparse.
+
+    Returns:
+        Namespace: Parsed arguments with difficulty, custom range and seed settings.
+    """
+    if len(sys.argv) == 1:
+        return SimpleNamespace(**DEFAULT_OPTIONS)
+
+    if len(sys.argv) == 3 and sys.argv[1] in ("-d", "--difficulty") and sys.argv[2] in difficulty_interval_map:
+        return SimpleNamespace(**{**DEFAULT_OPTIONS, "difficulty": sys.argv[2]})
+
+    parser = build_parser()
+    args = parser.parse_args()
+
+    try:
+        low, high = get_interval(args.difficulty, args.min, args.max)
+
+        if args.replay_log:
+            # Refuse the range before the game starts if the log can't store it
+            try:
+                from .replay_log import check_log_range
+            except ImportError:
+                from replay_log import check_log_range
+
+            check_log_range(low, high)
+    except ValueError as e:
+        parser.error(str(e))
+
+    return args
+
+def run_game(difficulty_setting: str, input_func=input, output_func=print,
+             low: int | None = None, high: int | None = None, rng: random.Random | None = None,
+             hint_strategy: str | None = None, replay_log=None, metrics=NULL_METRICS, notify=None):
     """
     Run the main game loop for the guessing game.
 
@@ -119,29 +303,57 @@ def run_game(difficulty_setting: str, input_func=input, output_func=print):
         difficulty_setting (str): The difficulty level.
         input_func (callable): Function to get user input (default: input).
         output_func (callable): Function to output messages (default: print).
+        low (int | None): Custom lower bound (default: difficulty lower bound).
+        high (int | None): Custom upper bound (default: difficulty upper bound).
+        rng (random.Random | None): Random generator to use, e.g. a seeded one (default: module random).
+        hint_strategy (str | None): Show the optimal next guess before each try following
+                                    this strategy ('minimax' or 'expected'), no hints if None.
+        replay_log (ReplayLogWriter | None): Log every guess to this replay log if provided.
+        metrics (Metrics | NullMetrics): Metrics for the tries and the time per guess and per game
+                                         (default: disabled).
+        notify (callable | None): Function to show the notice of a slow strategy table build
+                                  (default: output_func).
 
     Returns:
         tuple: (number of tries, list of tried numbers)
     """
     output_func(f"Selected difficulty is {difficulty_setting}")
 
+    low, high = get_interval(difficulty_setting, low, high)
+
     # Generate the target number
-    number = generate_random_number(difficulty_setting)
+    number = generate_random_number(difficulty_setting, low, high, rng)
+
+    if replay_log:
+        session_id = replay_log.start_session(low, high, number)
 
     output_func("Done generating number, let's play!")
 
-    guess = -1
+    if hint_strategy:
+        # Only load the strategy tables when hints are requested
+        try:
+            from .guess_strategy import get_strategy_table
+        except ImportError:
+            from guess_strategy import get_strategy_table
+
+        strategy_table = get_strategy_table(low, high, notify=notify or output_func)
+        hint_low, hint_high = low, high
+
+    guess = None
     tries = 0
     tried_numbers = []
+    game_start = time.perf_counter()
 
     # Main game loop
     while guess != number:
+        if hint_strategy:
+            output_func(f"Hint: the best guess now is {strategy_table.best_guess(hint_low, hint_high, hint_strategy)}")
+
         try:
-            guess = int(input_func(
-                f"Please provide a number between {difficulty_interval_map[difficulty_setting][0]} "
-                f"and {difficulty_interval_map[difficulty_setting][1]}: "
-            ))
+            with metrics.timer(GUESS_SECONDS, difficulty=difficulty_setting):
+                guess = int(input_func(f"Please provide a number between {low} and {high}: "))
         except ValueError:
+            metrics.inc(INVALID_INPUTS_TOTAL, difficulty=difficulty_setting)
             output_func("Invalid input! Please enter an integer.")
             continue
 
@@ -154,11 +366,81 @@ def run_game(difficulty_setting: str, input_func=input, output_func=print):
         # Analyze guess and provide feedback
         status = analyze_guess(guess, number)
         output_func(f"The number is {status}")
+
+        if replay_log:
+            replay_log.log_guess(session_id, number, low, high, guess, tries, status)
+
+        # Narrow the interval the hints are computed on
+        if hint_strategy and status == "higher":
+            hint_low = max(hint_low, guess + 1)
+        elif hint_strategy and status == "lower":
+            hint_high = min(hint_high, guess - 1)
+
         output_func(f"You have tried the following numbers: {tried_numbers}\n")
 
+    metrics.observe(GAME_SECONDS, time.perf_counter() - game_start, difficulty=difficulty_setting)
+    metrics.inc(GAMES_TOTAL, difficulty=difficulty_setting)
+    metrics.observe(GUESSES_PER_GAME, tries, buckets=TRIES_BUCKETS, difficulty=difficulty_setting)
+
     output_func(f"The game took {tries} tries.")
     return tries, tried_numbers
 
-if __name__ == "__main__":
+def main() -> None:
+    """
+    Parse the command-line arguments and play one game.
+    """
     args = parse_arguments()
-    run_game(args.difficulty)
\ No newline at end of file
+
+    try:
+        output = open_output(args)
+    except OSError as e:
+        print(f"Error opening output file:\n\t{e}")
+        sys.exit(1)
+
+    try:
+        metrics = open_metrics(args)
+    except OSError as e:
+        print(f"Error starting the metrics:\n\t{e}")
+        sys.exit(1)
+
+    def read_guess(prompt: str) -> str:
+        """Show the buffered messages before waiting for the player."""
+        output.flush()
+
+        if output.output_format == "plain":
+            return input(prompt)
+
+        # Keep the prompts out of the structured output
+        print(prompt, end="", file=sys.stderr, flush=True)
+        return input()
+
+    replay_log = None
+    if args.replay_log:
+        try:
+            from .replay_log import ReplayLogWriter
+        except ImportError:
+            from replay_log import ReplayLogWriter
+
+        replay_log = ReplayLogWriter(args.replay_log)
+
+    def show_notice(message: str) -> None:
+        """Show a notice right away, the game output is buffered until the next prompt."""
+        print(message, file=sys.stderr, flush=True)
+
+    try:
+        run_game(args.difficulty, input_func=read_guess, output_func=output.write, low=args.min, high=args.max,
+                 rng=random.Random(args.seed), hint_strategy=args.hints, replay_log=replay_log, metrics=metrics,
+                 notify=show_notice)
+    finally:
+        output.close()
+        metrics.close()
+        if replay_log:
+            replay_log.close()
+
+if __name__ == "__main__":
+
+    if "--startup-profile" in sys.argv[1:]:
+        from startup_profile.startup_profile import profile_startup
+        sys.exit(profile_startup("guess_number_game", sys.argv[1:], script=__file__))
+
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+
+"""
+Guess the Number Strategy Tables
+--------------------------------
+This module computes the optimal guessing strategies for the guessing game:
+
+- minimax: the guess that minimizes the worst case number of tries.
+- expected: the guess that minimizes the average number of tries when every
+  number of the interval is equally likely to be the target.
+
+The answer to a guess only depends on the guess position inside the remaining
+interval, so the best guess for [low, high] is low plus the best offset for an
+interval of size high - low + 1. Dynamic programming over the interval sizes gives
+the best offset for every sub-interval of a range at once.
+
+The tables are stored in a compact binary file that is memory-mapped, so each
+lookup is O(1). They are computed lazily on first use and reused by later runs.
+
+Usage:
+    python guess_strategy.py --difficulty hard
+    python guess_strategy.py --min 0 --max 5000
+"""
+
+# --- Import python libraries
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+try:
+    from .guess_number_game import analyze_guess, difficulty_interval_map, get_interval
+except ImportError:
+    from guess_number_game import analyze_guess, difficulty_interval_map, get_interval
+
+# --- Useful global variables
+
+OBJECTIVES = ("minimax", "expected")
+
+# File header: magic, format version, byte order of the arrays and table size
+HEADER_FORMAT = "<4sBcxxI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"GNGS"
+VERSION = 1
+BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+
+# The dynamic programming is quadratic in the interval size, larger intervals
+# fall back to guessing the middle, which is what the tables converge to.
+# Building the largest table takes a few seconds, so a notice is shown first.
+MAX_TABLE_SIZE = 4096
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "guess_number_game")
+
+# --- Method definitions
+
+
+def compute_tables(size: int) -> dict[str, array]:
+    """
+    Compute the optimal guessing tables for every interval size up to size.
+
+    For an interval of n numbers, guessing the offset k leaves k numbers below and
+    n - 1 - k numbers above the guess, so:
+        worst(n) = 1 + min over k of max(worst(k), worst(n - 1 - k))
+        total(n) = n + min over k of (total(k) + total(n - 1 - k))
+    where total(n) is the sum of tries needed for every possible target.
+
+    Args:
+        size (int): Largest interval size to compute.
+
+    Returns:
+        dict: Arrays indexed by interval size with the best offsets and costs
+              ('minimax_offset', 'minimax_cost', 'expected_offset', 'expected_cost').
+
+    Raises:
+        ValueError: If size is smaller than 1.
+    """
+    if size < 1:
+        raise ValueError("The table size must be at least 1")
+
+    minimax_offset = array("I", [0]) * (size + 1)
+    minimax_cost = array("I", [0]) * (size + 1)
+    expected_offset = array("I", [0]) * (size + 1)
+    expected_cost = array("I", [0]) * (size + 1)
+
+    for n in range(1, size + 1):
+        best_worst = best_total = None
+
+        # Splits are symmetric, so only offsets up to the middle need to be checked
+        for k in range(n // 2, -1, -1):
+            worst = max(minimax_cost[k], minimax_cost[n - 1 - k])
+            total = expected_cost[k] + expected_cost[n - 1 - k]
+
+            if best_worst is None or worst < best_worst:
+                best_worst = worst
+                minimax_offset[n] = k
+            if best_total is None or total < best_total:
+                best_total = total
+                expected_offset[n] = k
+
+        minimax_cost[n] = 1 + best_worst
+        expected_cost[n] = n + best_total
+
+    return {
+        "minimax_offset": minimax_offset,
+        "minimax_cost": minimax_cost,
+        "expected_offset": expected_offset,
+        "expected_cost": expected_cost,
+    }
+
+def save_tables(tables: dict[str, array], path: str) -> None:
+    """
+    Write the strategy tables to a binary file.
+
+    The file is written to a temporary path first and then renamed, so a reader
+    never sees a partially written table.
+
+    Args:
+        tables (dict): Tables as returned by compute_tables.
+        path (str): Destination file.
+    """
+    size = len(tables["minimax_offset"]) - 1
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(tmp_path, "wb") as tmp:
+        tmp.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, BYTE_ORDER, size))
+        for name in ("minimax_offset", "minimax_cost", "expected_offset", "expected_cost"):
+            tables[name].tofile(tmp)
+
+    os.replace(tmp_path, path)
+
+
+class StrategyTable:
+    """
+    Memory-mapped optimal guessing tables.
+
+    Args:
+        path (str): Binary file created by save_tables.
+
+    Raises:
+        ValueError: If the file isn't a valid strategy table for this machine.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as tmp:
+            self._mmap = mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, byte_order, size = struct.unpack_from(HEADER_FORMAT, self._mmap)
+            values = memoryview(self._mmap)[HEADER_SIZE:].cast("I")
+        except (struct.error, TypeError) as e:
+            self._mmap.close()
+            raise ValueError(f"Invalid strategy table file: {path}") from e
+
+        if (magic, version, byte_order) != (MAGIC, VERSION, BYTE_ORDER) or len(values) != 4 * (size + 1):
+            values.release()
+            self._mmap.close()
+            raise ValueError(f"Invalid strategy table file: {path}")
+
+        self.size = size
+        self._values = values
+        row = size + 1
+        self._offsets = {"minimax": values[:row], "expected": values[2 * row:3 * row]}
+        self._costs = {"minimax": values[row:2 * row], "expected": values[3 * row:]}
+
+    def close(self) -> None:
+        """Release the memory-mapped file."""
+        for view in (*self._offsets.values(), *self._costs.values(), self._values):
+            view.release()
+        self._mmap.close()
+
+    def best_guess(self, low: int, high: int, objective: str = "minimax") -> int:
+        """
+        Get the optimal guess for the remaining interval.
+
+        Args:
+            low (int): Lowest number the target can still be.
+            high (int): Highest number the target can still be.
+            objective (str): 'minimax' or 'expected' (default: 'minimax').
+
+        Returns:
+            int: The number to guess. Intervals larger than the table use the middle.
+
+        Raises:
+            ValueError: If the interval is empty or the objective is invalid.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError("Invalid objective provided. Please choose: 'minimax' or 'expected'")
+        if low > high:
+            raise ValueError(f"Invalid range provided: minimum {low} is greater than maximum {high}")
+
+        size = high - low + 1
+        if size > self.size:
+            return low + (size - 1) // 2
+
+        return low + self._offsets[objective][size]
+
+    def cost(self, low: int, high: int, objective: str = "minimax") -> float:
+        """
+        Get the number of tries the optimal strategy needs for the interval.
+
+        Args:
+            low (int): Lowest number the target can be.
+            high (int): Highest number the target can be.
+            objective (str): 'minimax' for the worst case or 'expected' for the average.
+
+        Returns:
+            int | float: Worst case number of tries (int) for 'minimax', average number of tries
+                         (float) for 'expected'.
+
+        Raises:
+            ValueError: If the interval is empty, larger than the table or the objective is invalid.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError("Invalid objective provided. Please choose: 'minimax' or 'expected'")
+
+        size = high - low + 1
+        if not 1 <= size <= self.size:
+            raise ValueError(f"The interval size must be between 1 and {self.size}")
+
+        if objective == "minimax":
+            return self._costs["minimax"][size]
+        return self._costs["expected"][size] / size
+
+
+# Tables already loaded by this process, keyed by file path
+_loaded_tables = {}
+
+def get_strategy_table(low: int, high: int, cache_dir: str | None = None, notify=None) -> StrategyTable:
+    """
+    Get the strategy table covering an interval, computing and saving it on first use.
+
+    Tables are computed for the next power of two of the interval size, so nearby
+    custom ranges share the same file.
+
+    Args:
+        low (int): Lowest number of the range.
+        high (int): Highest number of the range.
+        cache_dir (str | None): Directory to keep the table files (default: ~/.cache/guess_number_game).
+        notify (callable | None): Called with a message before a table is built, since large
+                                  tables take a few seconds (default: no message).
+
+    Returns:
+        StrategyTable: Table covering the interval, or its largest sub-intervals if it
+                       exceeds MAX_TABLE_SIZE.
+
+    Raises:
+        ValueError: If low is greater than high.
+    """
+    if low > high:
+        raise ValueError(f"Invalid range provided: minimum {low} is greater than maximum {high}")
+
+    size = min(1 << (high - low).bit_length(), MAX_TABLE_SIZE)
+    path = os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"strategy_{size}.bin")
+
+    if path not in _loaded_tables:
+        try:
+            table = StrategyTable(path)
+        except (OSError, ValueError):
+            if notify:
+                notify(f"Building the strategy table for up to {size} numbers, this only happens once...")
+            save_tables(compute_tables(size), path)
+            table = StrategyTable(path)
+
+        _loaded_tables[path] = table
+
+    return _loaded_tables[path]
+
+def play_bot(number: int, low: int, high: int, objective: str = "minimax",
+             cache_dir: str | None = None) -> tuple[int, list[int]]:
+    """
+    Let a bot find the target number following the optimal strategy.
+
+    Args:
+        number (int): The target number.
+        low (int): Lowest number of the range.
+        high (int): Highest number of the range.
+        objective (str): 'minimax' or 'expected' (default: 'minimax').
+        cache_dir (str | None): Directory to keep the table files.
+
+    Returns:
+        tuple: (number of tries, list of guesses in order)
+
+    Raises:
+        ValueError: If the number isn't inside the range.
+    """
+    if not low <= number <= high:
+        raise ValueError(f"The number {number} isn't between {low} and {high}")
+
+    table = get_strategy_table(low, high, cache_dir)
+    guesses = []
+
+    while True:
+        guess = table.best_guess(low, high, objective)
+        guesses.append(guess)
+
+        status = analyze_guess(guess, number)
+        if status == "correct":
+            return len(guesses), guesses
+        elif status == "higher":
+            low = guess + 1
+        else:
+            high = guess - 1
+
+def parse_arguments():
+    """
+    Parse command-line arguments for the strategy tables.
+
+    Returns:
+        Namespace: Parsed arguments with difficulty, custom range and cache settings.
+    """
+    parser = argparse.ArgumentParser(description="Guess the Number optimal strategy tables")
+    parser.add_argument(
+        "-d", "--difficulty",
+        choices=list(difficulty_interval_map),
+        default="normal",
+        help="Set the game difficulty level (default: normal)"
+    )
+    parser.add_argument("--min", type=int, default=None, help="Custom lower bound")
+    parser.add_argument("--max", type=int, default=None, help="Custom upper bound")
+    parser.add_argument("--cache-dir", default=None, help="Directory to keep the table files")
+    return parser.parse_args()
+
+def main() -> None:
+    """
+    Parse the command-line arguments and print the optimal first guesses.
+    """
+    args = parse_arguments()
+
+    try:
+        low, high = get_interval(args.difficulty, args.min, args.max)
+        table = get_strategy_table(low, high, args.cache_dir, notify=print)
+    except (ValueError, OSError) as e:
+        print(f"Error building the strategy table:\n\t{e}")
+        sys.exit(1)
+
+    print(f"Optimal strategy between {low} and {high}:")
+    for objective in OBJECTIVES:
+        print(f"\t{objective}: first guess {table.best_guess(low, high, objective)}", end="")
+        if high - low + 1 <= table.size:
+            print(f", {table.cost(low, high, objective):g} tries", end="")
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+"""
+Guess the Number Replay Log
+---------------------------
+This module keeps an append-only binary log of every guess made in the guessing
+game, and computes player statistics from it.
+
+Every game start and every guess is stored as a fixed-width little-endian record
+of 56 bytes:
+
+    session id   uint64   random id shared by all the records of a game
+    target       int64    number the player had to find
+    low, high    int64    interval of the game
+    guess        int64    number guessed, clamped to the int64 range (0 for a start)
+    timestamp    float64  seconds since the epoch
+    try number   uint32   1 for the first guess of the game (0 for a start)
+    status       uint8    0 = higher, 1 = lower, 2 = correct, 3 = game started
+
+The start record makes games abandoned before the first guess count as abandoned.
+Games only support intervals within int64, the game refuses --replay-log for
+larger custom ranges.
+
+Records are written through a large buffer, and the statistics are computed in a
+single pass over a memory-mapped log, so the log is never loaded in memory at once.
+
+Usage:
+    python guess_number_game.py --replay-log games.log
+    python replay_log.py games.log
+"""
+
+# --- Import python libraries
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+
+# --- Useful global variables
+
+RECORD = struct.Struct("<QqqqqdIB3x")
+RECORD_SIZE = RECORD.size
+
+STATUS_CODES = {"higher": 0, "lower": 1, "correct": 2}
+CORRECT = STATUS_CODES["correct"]
+STARTED = 3
+
+INT64_MIN = -2**63
+INT64_MAX = 2**63 - 1
+
+# Number of columns of the guess position heatmap, each one is a slice of the interval
+HEATMAP_COLUMNS = 10
+
+# Try numbers with their own heatmap row, later tries share one last overflow row
+HEATMAP_MAX_TRIES = 50
+
+# --- Class definitions
+
+
+class ReplayLogWriter:
+    """
+    Append guesses to a binary replay log through a buffered writer.
+
+    Args:
+        path (str): Log file, created if it doesn't exist.
+        buffer_size (int): Bytes kept in memory before writing to the file (default: 1 MiB).
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1024 * 1024):
+        self.path = path
+        self._file = open(path, "ab", buffering=buffer_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Write the buffered records and close the log."""
+        self._file.close()
+
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        self._file.flush()
+
+    def start_session(self, low: int, high: int, target: int, timestamp: float | None = None) -> int:
+        """
+        Log the start of a game and get its session id.
+
+        Args:
+            low (int): Lowest number of the game interval.
+            high (int): Highest number of the game interval.
+            target (int): Number the player has to find.
+            timestamp (float | None): Time the game started (default: now).
+
+        Returns:
+            int: Random 64-bit session id.
+
+        Raises:
+            ValueError: If the interval doesn't fit in 64-bit integers.
+        """
+        check_log_range(low, high)
+
+        session_id = int.from_bytes(os.urandom(8), "little")
+        self._file.write(RECORD.pack(session_id, target, low, high, 0,
+                                     time.time() if timestamp is None else timestamp, 0, STARTED))
+        return session_id
+
+    def log_guess(self, session_id: int, target: int, low: int, high: int, guess: int,
+                  try_number: int, status: str, timestamp: float | None = None) -> None:
+        """
+        Append a guess to the log.
+
+        Guesses outside the 64-bit range are clamped, their answer stays the same.
+
+        Args:
+            session_id (int): Id returned by start_session.
+            target (int): Number the player had to find.
+            low (int): Lowest number of the game interval.
+            high (int): Highest number of the game interval.
+            guess (int): Number guessed.
+            try_number (int): Position of the guess in the game, starting at 1.
+            status (str): 'higher', 'lower' or 'correct'.
+            timestamp (float | None): Time of the guess (default: now).
+        """
+        guess = min(max(guess, INT64_MIN), INT64_MAX)
+
+        self._file.write(RECORD.pack(session_id, target, low, high, guess,
+                                     time.time() if timestamp is None else timestamp,
+                                     try_number, STATUS_CODES[status]))
+
+
+# --- Method definitions
+
+def check_log_range(low: int, high: int) -> None:
+    """
+    Check that a game interval can be stored in the replay log.
+
+    Args:
+        low (int): Lowest number of the game interval.
+        high (int): Highest number of the game interval.
+
+    Raises:
+        ValueError: If the interval doesn't fit in 64-bit integers.
+    """
+    if low < INT64_MIN or high > INT64_MAX:
+        raise ValueError(f"The replay log only supports ranges between {INT64_MIN} and {INT64_MAX}")
+
+def iter_records(path: str):
+    """
+    Iterate over the records of a replay log without loading it in memory.
+
+    A partially written record at the end of the log is ignored.
+
+    Args:
+        path (str): Log file.
+
+    Yields:
+        tuple: (session_id, target, low, high, guess, timestamp, try_number, status)
+    """
+    with open(path, "rb") as tmp:
+        size = os.fstat(tmp.fileno()).st_size
+        size -= size % RECORD_SIZE
+        if size == 0:
+            return
+
+        with mmap.mmap(tmp.fileno(), size, access=mmap.ACCESS_READ) as log:
+            with memoryview(log) as view:
+                yield from RECORD.iter_unpack(view)
+
+def analyze_replay_log(path: str) -> dict:
+    """
+    Compute player statistics from a replay log in a single pass.
+
+    Only counters and a bounded heatmap are kept in memory while reading: the games
+    are counted from their start records, and the abandoned ones are the started games
+    that never got a correct guess, including games left before the first guess.
+
+    Logs written before start records existed are still supported: until the first
+    start record, the ids of the games in progress are kept to count their games.
+
+    Args:
+        path (str): Log file.
+
+    Returns:
+        dict: Statistics with the keys
+            'guesses' (int): number of guesses logged, game starts excluded,
+            'sessions' (int): number of games,
+            'completed' (int): games where the number was found,
+            'abandoned' (int): games where the number wasn't found,
+            'abandon_rate' (float): abandoned games over all games,
+            'mean_tries' (float): average tries of the completed games,
+            'heatmap' (list[list[int]]): guess counts per try number (rows, starting
+                with the first try) and per slice of the interval (columns). Tries after
+                HEATMAP_MAX_TRIES all go to one last overflow row.
+    """
+    started = 0
+    completed = 0
+    completed_tries = 0
+    guesses = 0
+    heatmap = []
+
+    # Games of old logs without start records, in progress and completed
+    legacy_open = set()
+    legacy_completed = 0
+
+    for session_id, _, low, high, guess, _, try_number, status in iter_records(path):
+        if status == STARTED:
+            started += 1
+            continue
+
+        guesses += 1
+
+        if status == CORRECT:
+            completed += 1
+            completed_tries += try_number
+
+        if not started:
+            if status == CORRECT:
+                legacy_open.discard(session_id)
+                legacy_completed += 1
+            else:
+                legacy_open.add(session_id)
+
+        # Place the guess in its slice of the interval, late tries share the overflow row
+        row = min(max(try_number, 1), HEATMAP_MAX_TRIES + 1) - 1
+        while len(heatmap) <= row:
+            heatmap.append([0] * HEATMAP_COLUMNS)
+        column = (min(max(guess, low), high) - low) * HEATMAP_COLUMNS // (high - low + 1)
+        heatmap[row][column] += 1
+
+    abandoned = max(started - (completed - legacy_completed), 0) + len(legacy_open)
+    sessions = completed + abandoned
+
+    return {
+        "guesses": guesses,
+        "sessions": sessions,
+        "completed": completed,
+        "abandoned": abandoned,
+        "abandon_rate": abandoned / sessions if sessions else 0.0,
+        "mean_tries": completed_tries / completed if completed else 0.0,
+        "heatmap": heatmap,
+    }
+
+def parse_arguments():
+    """
+    Parse command-line arguments for the replay log statistics.
+
+    Returns:
+        Namespace: Parsed arguments with the log path.
+    """
+    parser = argparse.ArgumentParser(description="Guess the Number replay log statistics")
+    parser.add_argument("log", help="Replay log written by guess_number_game.py --replay-log")
+    return parser.parse_args()
+
+def main() -> None:
+    """
+    Parse the command-line arguments and print the statistics of a replay log.
+    """
+    args = parse_arguments()
+
+    try:
+        stats = analyze_replay_log(args.log)
+    except OSError as e:
+        print(f"Error reading replay log:\n\t{e}")
+        sys.exit(1)
+
+    print(f"Guesses: {stats['guesses']}")
+    print(f"Games: {stats['sessions']} ({stats['completed']} completed, {stats['abandoned']} abandoned)")
+    print(f"Abandon rate: {stats['abandon_rate']:.2%}")
+    print(f"Mean tries: {stats['mean_tries']:.2f}")
+    print("Guess position heatmap (rows: try number, columns: slice of the interval):")
+    for try_number, row in enumerate(stats["heatmap"], start=1):
+        label = f"{try_number}+" if try_number > HEATMAP_MAX_TRIES else f"{try_number}"
+        print(f"\t{label:>3}: {' '.join(f'{count:>6}' for count in row)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# Import the unittest module and required components
+import asyncio
+import random
+import unittest
+
+# Import the classes to be tested
+from guess_number_game.game_server import GameServer, GameSession
+from guess_number_game.guess_number_game import generate_random_numbers
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+
+    """
+    Unit tests for the Guess Number Game server module.
+    Tests the session logic, full games over TCP, idle eviction and the memory budget.
+    """
+
+    async def start_server(self, **kwargs) -> GameServer:
+        """Start a server on a free local port and close it after the test."""
+        server = GameServer(**kwargs)
+        await server.start("127.0.0.1", 0)
+        self.addAsyncCleanup(server.close)
+        return server
+
+    async def connect(self, server: GameServer):
+        """Connect a player to the server."""
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        self.addCleanup(writer.close)
+        return reader, writer
+
+    # --- Test cases for GameSession class
+    def test_session_play(self):
+        """Test a session answers like the terminal game and ends on the correct guess."""
+
+        session = GameSession(7, writer=None, low=0, high=10)
+
+        self.assertEqual(session.play("abc"), (["Invalid input! Please enter an integer."], False))
+        self.assertEqual(session.play("11"), (["Please provide a number between 0 and 10"], False))
+
+        messages, game_over = session.play("3")
+        self.assertEqual(messages[0], "The number is higher")
+        self.assertFalse(game_over)
+
+        messages, game_over = session.play("7")
+        self.assertEqual(messages, ["The number is correct",
+                                    "You have tried the following numbers: [3, 7]",
+                                    "The game took 2 tries."])
+        self.assertTrue(game_over)
+
+    def test_session_uses_slots(self):
+        """Test sessions don't carry a per-instance dictionary."""
+
+        self.assertFalse(hasattr(GameSession(1, writer=None, low=0, high=10), "__dict__"))
+
+    def test_session_guess_limit(self):
+        """Test a session ends once the guesses allowed are used, keeping them sorted."""
+
+        session = GameSession(7, writer=None, low=0, high=10, max_guesses=3)
+
+        for guess in ("9", "1", "8"):
+            messages, game_over = session.play(guess)
+
+        self.assertEqual(session.tried_numbers, [1, 8, 9])
+        self.assertEqual(messages[-1], "Out of guesses, the number was 7.")
+        self.assertTrue(game_over)
+
+    # --- Test cases for GameServer class
+    async def test_play_full_game(self):
+        """Test a player can find a seeded target number over TCP."""
+
+        server = await self.start_server(difficulty="easy", seed=1)
+        target = random.Random(1).randint(0, 10)
+        reader, writer = await self.connect(server)
+
+        self.assertEqual(await reader.readline(), b"Selected difficulty is easy\n")
+        self.assertEqual(await reader.readline(), b"Please provide a number between 0 and 10\n")
+
+        writer.write(f"{target}\n".encode())
+        self.assertEqual(await reader.readline(), b"The number is correct\n")
+        await reader.readline()
+        self.assertEqual(await reader.readline(), b"The game took 1 tries.\n")
+        self.assertEqual(await reader.read(), b"")
+
+    async def test_seeded_targets_match_batches(self):
+        """Test the seeded server draws the targets of a batch generated with the same seed."""
+
+        server = await self.start_server(low=1, high=4, seed=9)
+        for _ in range(5):
+            reader, _ = await self.connect(server)
+            await reader.readline()
+
+        self.assertEqual(sorted(session.number for session in server.sessions),
+                         sorted(generate_random_numbers(5, low=1, high=4, seed=9)))
+
+    async def test_many_concurrent_sessions(self):
+        """Test the server keeps many concurrent sessions at once."""
+
+        server = await self.start_server()
+        players = [await self.connect(server) for _ in range(200)]
+        for reader, _ in players:
+            await reader.readline()
+
+        self.assertEqual(len(server.sessions), 200)
+
+    async def test_idle_session_eviction(self):
+        """Test idle players are disconnected after the timeout."""
+
+        server = await self.start_server(idle_timeout=0.1)
+        reader, _ = await self.connect(server)
+
+        lines = await asyncio.wait_for(reader.read(), timeout=2)
+
+        self.assertTrue(lines.endswith(b"Disconnected for being idle.\n"))
+        self.assertEqual(server.evicted, 1)
+        self.assertEqual(len(server.sessions), 0)
+
+    async def test_memory_budget_rejects_players(self):
+        """Test players are refused once the memory budget is used."""
+
+        server = await self.start_server(memory_budget=2 * GameServer().session_memory)
+        for _ in range(2):
+            reader, _ = await self.connect(server)
+            await reader.readline()
+
+        reader, _ = await self.connect(server)
+
+        self.assertEqual(await reader.read(), b"Server is full, please try again later.\n")
+        self.assertEqual(server.rejected, 1)
+
+    def test_session_memory_includes_guesses(self):
+        """Test the memory of a session grows with the guesses a wide range needs."""
+
+        server = GameServer(low=0, high=2**200)
+
+        self.assertEqual(server.max_guesses, 202)
+        self.assertGreater(server.session_memory, GameServer().session_memory)
+
+    def test_invalid_server_settings(self):
+        """Test invalid settings raise ValueError."""
+
+        with self.assertRaises(ValueError):
+            GameServer(difficulty="invalid")
+        with self.assertRaises(ValueError):
+            GameServer(idle_timeout=0)
+        with self.assertRaises(ValueError):
+            GameServer(memory_budget=1)
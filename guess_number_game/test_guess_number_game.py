@@ -1,9 +1,12 @@
 # Import the unittest module and required components
 import unittest
+import importlib.util
+import random
 from unittest.mock import patch
+from metrics.collector import Metrics
 
 # Import the functions to be tested
-from guess_number_game.guess_number_game import generate_random_number, get_user_int_input, analyze_guess, parse_arguments, run_game
+from guess_number_game.guess_number_game import get_interval, generate_random_number, generate_random_numbers, get_user_int_input, analyze_guess, parse_arguments, build_parser, run_game
 
 class TestGuessNumberGame(unittest.TestCase):
 
@@ -39,6 +42,56 @@ class TestGuessNumberGame(unittest.TestCase):
         with self.assertRaises(ValueError):
             generate_random_number("unknown")
 
+    def test_custom_range_generate_random_number(self):
+        """Test that a custom range beyond 2^64 generates a number within it."""
+
+        number = generate_random_number("normal", 2**64, 2**70)
+
+        self.assertGreaterEqual(number, 2**64)
+        self.assertLessEqual(number, 2**70)
+
+    def test_invalid_range_get_interval(self):
+        """Test that a minimum greater than the maximum raises ValueError."""
+
+        with self.assertRaises(ValueError):
+            get_interval("normal", 10, 5)
+
+    #--- Test cases for generate_random_numbers function
+    def test_generate_random_numbers_in_range(self):
+        """Test that batch generation returns the requested amount of numbers within the range."""
+
+        numbers = generate_random_numbers(1000, low=-5, high=2**80)
+
+        self.assertEqual(len(numbers), 1000)
+        self.assertTrue(all(-5 <= number <= 2**80 for number in numbers))
+
+    def test_generate_random_numbers_seed(self):
+        """Test that the same seed generates the same numbers."""
+
+        self.assertEqual(generate_random_numbers(100, "hard", seed=42), generate_random_numbers(100, "hard", seed=42))
+
+    def test_generate_random_numbers_match_game(self):
+        """Test that a seeded batch gives the targets of the seeded game, power of two spans included."""
+
+        for low, high in ((0, 10), (1, 4), (0, 2**64 - 1), (-5, 2**80)):
+            with self.subTest(low=low, high=high):
+                rng = random.Random(42)
+                game_targets = [generate_random_number("normal", low, high, rng) for _ in range(50)]
+
+                self.assertEqual(generate_random_numbers(50, low=low, high=high, seed=42), game_targets)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed")
+    def test_generate_random_numbers_numpy(self):
+        """Test the NumPy backend: numbers within the range, reproducible, 64-bit ranges only."""
+
+        numbers = generate_random_numbers(1000, low=-5, high=2**40, seed=3, use_numpy=True)
+
+        self.assertEqual(len(numbers), 1000)
+        self.assertTrue(all(-5 <= number <= 2**40 for number in numbers))
+        self.assertEqual(numbers, generate_random_numbers(1000, low=-5, high=2**40, seed=3, use_numpy=True))
+        with self.assertRaises(ValueError):
+            generate_random_numbers(1, low=0, high=2**63, use_numpy=True)
+
     #--- Test cases for get_user_int_input function
 
     def test_easy_user_input(self):
@@ -88,6 +141,34 @@ class TestGuessNumberGame(unittest.TestCase):
         with patch('sys.argv', test_args):
             args = parse_arguments()
             self.assertEqual(args.difficulty, 'normal')
+            self.assertIsNone(args.min)
+            self.assertIsNone(args.max)
+            self.assertIsNone(args.seed)
+
+    def test_parse_arguments_fast_path(self):
+        """Test that the options used without argparse match the parser defaults."""
+
+        for argv in ([], ['-d', 'easy'], ['--difficulty', 'hard']):
+            with self.subTest(argv=argv), patch('sys.argv', ['guess_number_game.py', *argv]):
+                args = parse_arguments()
+
+                self.assertEqual(vars(args), vars(build_parser().parse_args(argv)))
+
+    def test_parse_arguments_custom_range(self):
+        """Test argument parsing of a custom range and seed."""
+
+        test_args = ['guess_number_game.py', '--min', '5', '--max', str(2**64), '--seed', '7']
+        with patch('sys.argv', test_args):
+            args = parse_arguments()
+            self.assertEqual((args.min, args.max, args.seed), (5, 2**64, 7))
+
+    def test_parse_arguments_invalid_range(self):
+        """Test argument parsing with a minimum greater than the maximum exits the program."""
+
+        test_args = ['guess_number_game.py', '--min', '20', '--max', '10']
+        with patch('sys.argv', test_args), patch('sys.stderr'):
+            with self.assertRaises(SystemExit):
+                parse_arguments()
 
     def test_parse_arguments_easy(self):
         """Test argument parsing sets difficulty to 'easy'."""
@@ -136,6 +217,24 @@ class TestGuessNumberGame(unittest.TestCase):
             self.assertIn("The number is correct", outputs[-3])
             self.assertIn("The game took 1 tries.", outputs[-1])
 
+    def test_run_game_metrics(self):
+        """Test that run_game records the tries, invalid inputs and time of each answer."""
+
+        guesses = iter(['2', 'abc', '9', '5'])
+        metrics = Metrics()
+
+        with patch('guess_number_game.guess_number_game.generate_random_number', return_value=5):
+            run_game('easy', input_func=lambda prompt: next(guesses), output_func=lambda message: None,
+                     metrics=metrics)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["guess_number_game_games_total"][0]["value"], 1)
+        self.assertEqual(snapshot["counters"]["guess_number_game_invalid_inputs_total"][0]["value"], 1)
+        self.assertEqual(snapshot["histograms"]["guess_number_game_guesses_per_game"][0]["sum"], 3)
+        # Every answer to the prompt is timed, the invalid one too
+        self.assertEqual(snapshot["histograms"]["guess_number_game_guess_seconds"][0]["count"], 4)
+        self.assertEqual(snapshot["histograms"]["guess_number_game_game_seconds"][0]["labels"], {"difficulty": "easy"})
+
     def test_normal_run_game(self):
         """Test run_game for 'normal' difficulty with mocked input/output."""
         
@@ -183,3 +282,28 @@ class TestGuessNumberGame(unittest.TestCase):
         
         with self.assertRaises(ValueError):
             run_game('invalid')
+
+    def test_negative_range_run_game(self):
+        """Test run_game asks for a guess when the target is -1 in a negative range."""
+
+        with patch('guess_number_game.guess_number_game.generate_random_number', return_value=-1):
+            tries, tried_numbers = run_game('normal', input_func=lambda prompt: '-1',
+                                            output_func=lambda message: None, low=-5, high=-1)
+        self.assertEqual(tries, 1)
+        self.assertEqual(tried_numbers, [-1])
+
+    def test_seeded_custom_range_run_game(self):
+        """Test run_game with a custom range and seeded generator finds the reproducible target."""
+
+        target = generate_random_number('normal', 0, 2**64, random.Random(3))
+        prompts = []
+
+        def mock_input(prompt):
+            prompts.append(prompt)
+            return str(target)
+
+        tries, tried_numbers = run_game('normal', input_func=mock_input, output_func=lambda message: None,
+                                        low=0, high=2**64, rng=random.Random(3))
+        self.assertEqual(tries, 1)
+        self.assertEqual(tried_numbers, [target])
+        self.assertIn(f"between 0 and {2**64}", prompts[0])
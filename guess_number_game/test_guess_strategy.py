@@ -0,0 +1,164 @@
+# Import the unittest module and required components
+import os
+import tempfile
+import unittest
+from functools import cache
+from unittest.mock import patch
+
+# Import the functions to be tested
+from guess_number_game import guess_strategy
+from guess_number_game.guess_strategy import compute_tables, save_tables, StrategyTable, get_strategy_table, play_bot
+from guess_number_game.guess_number_game import run_game
+
+class TestGuessStrategy(unittest.TestCase):
+
+    """
+    Unit tests for the Guess Number strategy tables module.
+    Tests the dynamic programming, the table file, lazy loading and the bot.
+    """
+
+    def setUp(self):
+        """Keep the table files of each test in its own temporary directory."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache_dir = tmp_dir.name
+
+        patcher = patch.dict(guess_strategy._loaded_tables, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # --- Test cases for compute_tables function
+    def test_compute_tables_matches_brute_force(self):
+        """Test the tables match a brute force search over every sub-interval."""
+
+        @cache
+        def worst(low, high):
+            if low > high:
+                return 0
+            return min(1 + max(worst(low, g - 1), worst(g + 1, high)) for g in range(low, high + 1))
+
+        @cache
+        def total(low, high):
+            if low > high:
+                return 0
+            return (high - low + 1) + min(total(low, g - 1) + total(g + 1, high) for g in range(low, high + 1))
+
+        tables = compute_tables(20)
+        for n in range(1, 21):
+            with self.subTest(size=n):
+                self.assertEqual(tables["minimax_cost"][n], worst(0, n - 1))
+                self.assertEqual(tables["expected_cost"][n], total(0, n - 1))
+
+    def test_compute_tables_minimax_is_binary_search(self):
+        """Test the worst case number of tries is the bit length of the interval size."""
+
+        tables = compute_tables(300)
+        for n in range(1, 301):
+            with self.subTest(size=n):
+                self.assertEqual(tables["minimax_cost"][n], n.bit_length())
+
+    def test_compute_tables_invalid_size(self):
+        """Test an empty table raises ValueError."""
+
+        with self.assertRaises(ValueError):
+            compute_tables(0)
+
+    # --- Test cases for StrategyTable class
+    def test_save_and_load_table(self):
+        """Test a saved table is read back with the same values."""
+
+        path = os.path.join(self.cache_dir, "table.bin")
+        save_tables(compute_tables(128), path)
+        table = StrategyTable(path)
+        self.addCleanup(table.close)
+
+        self.assertEqual(table.size, 128)
+        self.assertEqual(table.best_guess(0, 100), 50)
+        self.assertEqual(table.best_guess(1000, 1002, "expected"), 1001)
+        self.assertEqual(table.cost(0, 100, "minimax"), 7)
+        self.assertAlmostEqual(table.cost(0, 2, "expected"), 5 / 3)
+
+    def test_best_guess_large_interval(self):
+        """Test intervals larger than the table fall back to the middle."""
+
+        table = get_strategy_table(0, 10, self.cache_dir)
+
+        self.assertEqual(table.best_guess(0, 2**64), 2**63)
+
+    def test_invalid_table_file(self):
+        """Test an invalid table file raises ValueError."""
+
+        path = os.path.join(self.cache_dir, "table.bin")
+        with open(path, "wb") as tmp:
+            tmp.write(b"not a table")
+
+        with self.assertRaises(ValueError):
+            StrategyTable(path)
+
+    # --- Test cases for get_strategy_table function
+    def test_get_strategy_table_persists(self):
+        """Test the table is computed once and reused by later runs."""
+
+        table = get_strategy_table(0, 100, self.cache_dir)
+        self.assertEqual(table.size, 128)
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, "strategy_128.bin")))
+
+        # Forget the loaded tables to simulate a new run
+        guess_strategy._loaded_tables.clear()
+        with patch("guess_number_game.guess_strategy.compute_tables") as mock_compute:
+            get_strategy_table(0, 100, self.cache_dir)
+            mock_compute.assert_not_called()
+
+    def test_get_strategy_table_rebuilds_invalid_file(self):
+        """Test an invalid table file is computed again."""
+
+        with open(os.path.join(self.cache_dir, "strategy_16.bin"), "wb") as tmp:
+            tmp.write(b"not a table")
+
+        messages = []
+        table = get_strategy_table(0, 10, self.cache_dir, notify=messages.append)
+
+        self.assertEqual(table.best_guess(0, 10), 5)
+        self.assertEqual(messages, ["Building the strategy table for up to 16 numbers, this only happens once..."])
+
+        # A saved table is loaded without a notice
+        guess_strategy._loaded_tables.clear()
+        messages.clear()
+        get_strategy_table(0, 10, self.cache_dir, notify=messages.append)
+        self.assertEqual(messages, [])
+
+    # --- Test cases for play_bot function
+    def test_play_bot(self):
+        """Test the bot finds every number of the 'hard' range in at most 7 tries."""
+
+        for objective in ("minimax", "expected"):
+            for number in range(0, 101):
+                with self.subTest(objective=objective, number=number):
+                    tries, guesses = play_bot(number, 0, 100, objective, self.cache_dir)
+                    self.assertLessEqual(tries, 7)
+                    self.assertEqual(guesses[-1], number)
+
+    def test_play_bot_invalid_number(self):
+        """Test a number outside the range raises ValueError."""
+
+        with self.assertRaises(ValueError):
+            play_bot(11, 0, 10, cache_dir=self.cache_dir)
+
+    # --- Test cases for run_game hints
+    def test_run_game_hints(self):
+        """Test run_game shows the optimal guess for the remaining interval."""
+
+        guesses = iter(["5", "8"])
+        outputs = []
+        notices = []
+
+        with patch("guess_number_game.guess_strategy.DEFAULT_CACHE_DIR", self.cache_dir), \
+             patch("guess_number_game.guess_number_game.generate_random_number", return_value=8):
+            tries, _ = run_game("easy", input_func=lambda prompt: next(guesses), output_func=outputs.append,
+                                hint_strategy="minimax", notify=notices.append)
+
+        self.assertEqual(tries, 2)
+        self.assertEqual(len(notices), 1)
+        self.assertIn("Building the strategy table", notices[0])
+        hints = [message for message in outputs if message.startswith("Hint")]
+        self.assertEqual(hints, ["Hint: the best guess now is 5", "Hint: the best guess now is 8"])
@@ -0,0 +1,161 @@
+# Import the unittest module and required components
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Import the functions to be tested
+from guess_number_game.replay_log import ReplayLogWriter, iter_records, analyze_replay_log, RECORD_SIZE, HEATMAP_MAX_TRIES
+from guess_number_game.guess_number_game import run_game, main
+
+class TestReplayLog(unittest.TestCase):
+
+    """
+    Unit tests for the Guess Number replay log module.
+    Tests writing records, reading them back and the streaming statistics.
+    """
+
+    def setUp(self):
+        """Write each test log in its own temporary directory."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.log_path = os.path.join(tmp_dir.name, "games.log")
+
+    def write_games(self, games: list[tuple[int, list[int]]]) -> None:
+        """Log a list of (target, guesses) games in the 0-100 interval."""
+        with ReplayLogWriter(self.log_path) as replay_log:
+            for target, guesses in games:
+                session_id = replay_log.start_session(0, 100, target, timestamp=1.0)
+                for try_number, guess in enumerate(guesses, start=1):
+                    status = "higher" if guess < target else "lower" if guess > target else "correct"
+                    replay_log.log_guess(session_id, target, 0, 100, guess, try_number, status, timestamp=1.5)
+
+    # --- Test cases for ReplayLogWriter class
+    def test_write_and_read_records(self):
+        """Test logged guesses are read back as fixed-width records."""
+
+        self.write_games([(30, [50, 30])])
+
+        records = list(iter_records(self.log_path))
+
+        self.assertEqual(os.path.getsize(self.log_path), 3 * RECORD_SIZE)
+        self.assertEqual([record[1:] for record in records],
+                         [(30, 0, 100, 0, 1.0, 0, 3), (30, 0, 100, 50, 1.5, 1, 1), (30, 0, 100, 30, 1.5, 2, 2)])
+        self.assertEqual(len({record[0] for record in records}), 1)
+
+    def test_log_is_append_only(self):
+        """Test a new writer appends to the existing log."""
+
+        self.write_games([(30, [30])])
+        self.write_games([(40, [40])])
+
+        self.assertEqual(len(list(iter_records(self.log_path))), 4)
+
+    def test_large_guess_is_clamped(self):
+        """Test guesses outside the 64-bit range are clamped."""
+
+        self.write_games([(30, [2**70, 30])])
+
+        self.assertEqual(list(iter_records(self.log_path))[1][4], 2**63 - 1)
+
+    def test_start_session_large_range(self):
+        """Test ranges outside 64-bit integers raise ValueError."""
+
+        with ReplayLogWriter(self.log_path) as replay_log:
+            with self.assertRaises(ValueError):
+                replay_log.start_session(0, 2**64, 5)
+
+    def test_main_refuses_large_range(self):
+        """Test the game refuses a replay log for a range outside 64-bit integers before it starts."""
+
+        argv = ["guess_number_game.py", "--replay-log", self.log_path, "--min", "0", "--max", str(2**64)]
+        with patch("sys.argv", argv), patch("sys.stderr") as stderr, patch("builtins.input") as mock_input:
+            with self.assertRaises(SystemExit) as exit_context:
+                main()
+
+        self.assertEqual(exit_context.exception.code, 2)
+        self.assertIn("The replay log only supports ranges", "".join(call.args[0] for call in stderr.write.call_args_list))
+        mock_input.assert_not_called()
+
+    # --- Test cases for analyze_replay_log function
+    def test_analyze_replay_log(self):
+        """Test the statistics of completed and abandoned games."""
+
+        self.write_games([(30, [50, 30]), (95, [50, 75, 90]), (10, [50, 10])])
+
+        stats = analyze_replay_log(self.log_path)
+
+        self.assertEqual(stats["guesses"], 7)
+        self.assertEqual(stats["sessions"], 3)
+        self.assertEqual(stats["completed"], 2)
+        self.assertEqual(stats["abandoned"], 1)
+        self.assertAlmostEqual(stats["abandon_rate"], 1 / 3)
+        self.assertEqual(stats["mean_tries"], 2.0)
+        self.assertEqual(stats["heatmap"][0][4], 3)
+        self.assertEqual(stats["heatmap"][1], [1, 0, 1, 0, 0, 0, 0, 1, 0, 0])
+        self.assertEqual(stats["heatmap"][2][8], 1)
+
+    def test_analyze_game_without_guesses(self):
+        """Test a game left before the first guess counts as abandoned."""
+
+        self.write_games([(30, [30]), (40, [])])
+
+        stats = analyze_replay_log(self.log_path)
+
+        self.assertEqual((stats["guesses"], stats["sessions"], stats["abandoned"]), (1, 2, 1))
+
+    def test_analyze_log_without_start_records(self):
+        """Test games logged before start records existed are still counted, before newer games."""
+
+        with ReplayLogWriter(self.log_path) as replay_log:
+            replay_log.log_guess(1, 30, 0, 100, 50, 1, "lower")
+            replay_log.log_guess(2, 70, 0, 100, 50, 1, "higher")
+            replay_log.log_guess(1, 30, 0, 100, 30, 2, "correct")
+        self.write_games([(30, [30]), (40, [50])])
+
+        stats = analyze_replay_log(self.log_path)
+
+        self.assertEqual((stats["sessions"], stats["completed"], stats["abandoned"]), (4, 2, 2))
+
+    def test_analyze_heatmap_is_bounded(self):
+        """Test tries after HEATMAP_MAX_TRIES share one overflow row."""
+
+        self.write_games([(100, list(range(HEATMAP_MAX_TRIES + 30)))])
+
+        heatmap = analyze_replay_log(self.log_path)["heatmap"]
+
+        self.assertEqual(len(heatmap), HEATMAP_MAX_TRIES + 1)
+        self.assertEqual(sum(heatmap[-1]), 30)
+
+    def test_analyze_empty_log(self):
+        """Test an empty log has no games."""
+
+        open(self.log_path, "wb").close()
+
+        stats = analyze_replay_log(self.log_path)
+
+        self.assertEqual((stats["sessions"], stats["mean_tries"], stats["heatmap"]), (0, 0.0, []))
+
+    def test_analyze_ignores_partial_record(self):
+        """Test a partially written record at the end of the log is ignored."""
+
+        self.write_games([(30, [30])])
+        with open(self.log_path, "ab") as tmp:
+            tmp.write(b"\x00" * (RECORD_SIZE // 2))
+
+        self.assertEqual(analyze_replay_log(self.log_path)["guesses"], 1)
+
+    # --- Test cases for run_game replay log
+    def test_run_game_replay_log(self):
+        """Test run_game logs every guess of the game."""
+
+        guesses = iter(["2", "9", "5"])
+
+        with ReplayLogWriter(self.log_path) as replay_log, \
+             patch("guess_number_game.guess_number_game.generate_random_number", return_value=5):
+            run_game("easy", input_func=lambda prompt: next(guesses), output_func=lambda message: None,
+                     replay_log=replay_log)
+
+        records = list(iter_records(self.log_path))
+        self.assertEqual([(record[4], record[6], record[7]) for record in records],
+                         [(0, 0, 3), (2, 1, 0), (9, 2, 1), (5, 3, 2)])
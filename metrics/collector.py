@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+
+"""
+Metrics collector
+-----------------
+Live metrics and their exporters, imported by open_metrics only when a metrics
+option is given:
+
+- Metrics: thread safe counters and histograms
+- SnapshotWriter: rewrites a JSON snapshot of the metrics from a background thread
+- MetricsServer: serves the metrics in Prometheus text format over HTTP
+"""
+
+# --- Import python libraries
+
+import os
+import sys
+import time
+
+from .metrics import DEFAULT_SNAPSHOT_INTERVAL, LATENCY_BUCKETS
+
+# --- Class definitions
+
+
+class _Timer:
+    """Context manager observing the seconds spent inside it in a histogram."""
+
+    __slots__ = ("_metrics", "_name", "_labels", "_start")
+
+    def __init__(self, metrics, name: str, labels: dict):
+        self._metrics = metrics
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._metrics.observe(self._name, time.perf_counter() - self._start, **self._labels)
+
+
+class Metrics:
+    """
+    Counters and histograms, identified by a name and optional labels.
+
+    Updates are thread safe, so the exporters can read the metrics while the tool
+    keeps updating them.
+
+    Args:
+        exporters (list | None): Objects with a close() method, closed with the metrics
+                                 (default: none).
+    """
+
+    enabled = True
+
+    def __init__(self, exporters: list | None = None):
+        import threading
+        from bisect import bisect_left
+
+        self._bisect_left = bisect_left
+        self.exporters = list(exporters or [])
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name (str): Counter name.
+            amount (float): Amount to add (default: 1).
+            **labels: Labels of the counter.
+        """
+        key = (name, tuple(sorted(labels.items())))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels) -> None:
+        """
+        Add a value to a histogram.
+
+        Args:
+            name (str): Histogram name.
+            value (float): Observed value.
+            buckets (tuple): Increasing upper bounds of the buckets, only used when the
+                             histogram is created (default: LATENCY_BUCKETS).
+            **labels: Labels of the histogram.
+        """
+        key = (name, tuple(sorted(labels.items())))
+
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # Bounds, count per bucket (the last one is +Inf), sum
+                histogram = self._histograms[key] = [tuple(buckets), [0] * (len(buckets) + 1), 0]
+
+            histogram[1][self._bisect_left(histogram[0], value)] += 1
+            histogram[2] += value
+
+    def timer(self, name: str, **labels) -> _Timer:
+        """
+        Time a block of code in a histogram of seconds.
+
+        Args:
+            name (str): Histogram name.
+            **labels: Labels of the histogram.
+
+        Returns:
+            _Timer: Context manager observing the seconds spent inside it.
+        """
+        return _Timer(self, name, labels)
+
+    def snapshot(self) -> dict:
+        """
+        Get the current value of every metric.
+
+        Returns:
+            dict: Timestamp, counters and histograms (with cumulative bucket counts, as in
+                  Prometheus), each one as a list of {labels, ...} per name.
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            histograms = [(key, bounds, list(counts), total)
+                          for key, (bounds, counts, total) in self._histograms.items()]
+
+        snapshot = {"timestamp": time.time(), "counters": {}, "histograms": {}}
+
+        for (name, labels), value in sorted(counters):
+            snapshot["counters"].setdefault(name, []).append({"labels": dict(labels), "value": value})
+
+        for (name, labels), bounds, counts, total in sorted(histograms, key=lambda histogram: histogram[0]):
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip((*bounds, "+Inf"), counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+
+            snapshot["histograms"].setdefault(name, []).append(
+                {"labels": dict(labels), "count": cumulative, "sum": total, "buckets": buckets})
+
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """
+        Format the current metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: One sample per line, with a TYPE line per metric.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, series in snapshot["counters"].items():
+            lines.append(f"# TYPE {name} counter")
+            for sample in series:
+                lines.append(f"{name}{_format_labels(sample['labels'])} {sample['value']}")
+
+        for name, series in snapshot["histograms"].items():
+            lines.append(f"# TYPE {name} histogram")
+            for sample in series:
+                for bound, count in sample["buckets"].items():
+                    labels = _format_labels({**sample["labels"], "le": bound})
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = _format_labels(sample["labels"])
+                lines.append(f"{name}_sum{labels} {sample['sum']}")
+                lines.append(f"{name}_count{labels} {sample['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_snapshot(self, path: str) -> None:
+        """
+        Write the current metrics to a JSON file.
+
+        Args:
+            path (str): File to write, replaced in one step so readers never see half a snapshot.
+        """
+        import json
+
+        tmp_file = f"{path}.tmp"
+        with open(tmp_file, "w") as tmp:
+            json.dump(self.snapshot(), tmp, indent=2)
+
+        os.replace(tmp_file, path)
+
+    def close(self) -> None:
+        """Stop the exporters, which publish the final metrics."""
+        while self.exporters:
+            self.exporters.pop().close()
+
+
+class SnapshotWriter:
+    """
+    Rewrite a JSON snapshot of the metrics periodically from a background thread.
+
+    Args:
+        metrics (Metrics): Metrics to write.
+        path (str): Snapshot file.
+        interval (float): Seconds between snapshots (default: 10).
+    """
+
+    def __init__(self, metrics: Metrics, path: str, interval: float = DEFAULT_SNAPSHOT_INTERVAL):
+        import threading
+
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.metrics.write_snapshot(self.path)
+            except OSError as e:
+                print(f"Error writing metrics snapshot:\n\t{e}", file=sys.stderr)
+
+    def close(self) -> None:
+        """Stop the background thread and write the final snapshot."""
+        self._stop.set()
+        self._thread.join()
+        self.metrics.write_snapshot(self.path)
+
+
+class MetricsServer:
+    """
+    Serve the metrics in Prometheus text format on a local HTTP endpoint.
+
+    Args:
+        metrics (Metrics): Metrics to serve on /metrics.
+        port (int): TCP port, 0 to pick a free one (see the port attribute).
+        host (str): Address to listen on (default: 127.0.0.1, local only).
+
+    Raises:
+        OSError: If the port can't be used.
+    """
+
+    def __init__(self, metrics: Metrics, port: int, host: str = "127.0.0.1"):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+
+                body = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # keep the tool output clean
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop serving the metrics."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+# --- Method definitions
+
+def _format_labels(labels: dict) -> str:
+    """Format labels as {name="value",...}, empty if there are none."""
+    if not labels:
+        return ""
+
+    formatted = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        formatted.append(f'{name}="{value}"')
+
+    return "{" + ",".join(formatted) + "}"
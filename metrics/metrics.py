@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Metrics
+-------
+Shared instrumentation layer for the palindrome checker, the calculator and the
+guessing game.
+
+The tools count events and time their stages through a Metrics object:
+
+- inc(name, amount, **labels): add to a counter
+- observe(name, value, **labels): add a value to a histogram
+- timer(name, **labels): context manager observing the seconds spent inside it
+
+The collected metrics are exposed as a JSON snapshot file rewritten every few
+seconds (--metrics-file) and/or as Prometheus text on a local HTTP endpoint
+(--metrics-port).
+
+When neither option is given the tools get NULL_METRICS, whose methods do nothing,
+so instrumented code runs unchanged and no thread, lock or socket is created. This
+module only holds the options and the disabled metrics, the live metrics and their
+exporters live in metrics.collector, which is imported when they are enabled.
+
+Usage:
+    python -m palindrome_checker words.txt --follow --metrics-file metrics.json
+    curl http://127.0.0.1:9100/metrics
+"""
+
+# --- Useful global variables
+
+# Upper bounds of the histogram buckets for durations, in seconds
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+DEFAULT_SNAPSHOT_INTERVAL = 10.0
+
+# Values of the metrics options when they aren't given
+METRICS_DEFAULTS = {
+    "metrics_file": None,
+    "metrics_interval": DEFAULT_SNAPSHOT_INTERVAL,
+    "metrics_port": None,
+}
+
+# --- Class definitions
+
+
+class _NullTimer:
+    """Timer of the disabled metrics, does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class NullMetrics:
+    """
+    Disabled metrics with the same methods as Metrics, all doing nothing.
+    """
+
+    enabled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        pass
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels) -> None:
+        pass
+
+    def timer(self, name: str, **labels) -> _NullTimer:
+        return _NULL_TIMER
+
+    def close(self) -> None:
+        pass
+
+
+# --- Method definitions
+
+def add_metrics_arguments(parser) -> None:
+    """
+    Add the metrics options shared by all the tools to an argument parser.
+
+    Args:
+        parser (ArgumentParser): Parser to add the options to.
+    """
+    parser.add_argument(
+        "--metrics-file",
+        default=METRICS_DEFAULTS["metrics_file"],
+        help="Write a JSON snapshot of the metrics to this file periodically and on exit"
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=METRICS_DEFAULTS["metrics_interval"],
+        help=f"Seconds between metrics snapshots (default: {DEFAULT_SNAPSHOT_INTERVAL:g})"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=METRICS_DEFAULTS["metrics_port"],
+        help="Serve the metrics in Prometheus text format on http://127.0.0.1:PORT/metrics"
+    )
+
+def open_metrics(args) -> "Metrics | NullMetrics":
+    """
+    Create the metrics selected by the shared metrics options.
+
+    Args:
+        args (Namespace): Parsed arguments with the options of add_metrics_arguments.
+
+    Returns:
+        Metrics | NullMetrics: Metrics with the selected exporters, NULL_METRICS if none was selected.
+
+    Raises:
+        OSError: If the metrics port can't be used.
+    """
+    if args.metrics_file is None and args.metrics_port is None:
+        return NULL_METRICS
+
+    from .collector import Metrics, MetricsServer, SnapshotWriter
+
+    metrics = Metrics()
+
+    try:
+        if args.metrics_port is not None:
+            metrics.exporters.append(MetricsServer(metrics, args.metrics_port))
+        if args.metrics_file is not None:
+            metrics.exporters.append(SnapshotWriter(metrics, args.metrics_file, args.metrics_interval))
+    except OSError:
+        metrics.close()
+        raise
+
+    return metrics
+
+
+# Shared disabled metrics, used by the tools when no metrics option is given
+NULL_METRICS = NullMetrics()
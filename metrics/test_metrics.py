@@ -0,0 +1,144 @@
+# --- Import required python libraries
+import unittest
+import tempfile
+import json
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+from urllib.request import urlopen
+from urllib.error import HTTPError
+
+# --- Import the functions to be tested
+from metrics.collector import Metrics, MetricsServer, SnapshotWriter
+from metrics.metrics import NULL_METRICS, open_metrics
+
+class TestMetrics(unittest.TestCase):
+    """
+    Unit tests for the metrics module.
+    Tests counters, histograms, both exporters and the disabled metrics.
+    """
+
+    def test_counters(self):
+        """
+        Test that counters add up per name and labels.
+        """
+
+        metrics = Metrics()
+        metrics.inc("words_total", stage="read")
+        metrics.inc("words_total", 2, stage="read")
+        metrics.inc("words_total", stage="emit")
+
+        self.assertEqual(metrics.snapshot()["counters"], {"words_total": [
+            {"labels": {"stage": "emit"}, "value": 1},
+            {"labels": {"stage": "read"}, "value": 3},
+        ]})
+
+    def test_histograms(self):
+        """
+        Test that histograms count the observed values in cumulative buckets.
+        """
+
+        metrics = Metrics()
+        for value in (1, 2, 2, 7, 100):
+            metrics.observe("tries", value, buckets=(1, 2, 5, 10))
+
+        self.assertEqual(metrics.snapshot()["histograms"], {"tries": [{
+            "labels": {},
+            "count": 5,
+            "sum": 112,
+            "buckets": {"1": 1, "2": 3, "5": 3, "10": 4, "+Inf": 5},
+        }]})
+
+    def test_timer(self):
+        """
+        Test that the timer observes the seconds spent in the block.
+        """
+
+        metrics = Metrics()
+        with metrics.timer("stage_seconds", stage="check"):
+            pass
+
+        histogram = metrics.snapshot()["histograms"]["stage_seconds"][0]
+        self.assertEqual((histogram["labels"], histogram["count"]), ({"stage": "check"}, 1))
+        self.assertGreaterEqual(histogram["sum"], 0)
+
+    def test_to_prometheus(self):
+        """
+        Test the Prometheus text format, with escaped label values.
+        """
+
+        metrics = Metrics()
+        metrics.inc("operations_total", operation='say "hi"')
+        metrics.observe("tries", 3, buckets=(2, 5))
+
+        self.assertEqual(metrics.to_prometheus(), "# TYPE operations_total counter\n"
+                                                  'operations_total{operation="say \\"hi\\""} 1\n'
+                                                  "# TYPE tries histogram\n"
+                                                  'tries_bucket{le="2"} 0\n'
+                                                  'tries_bucket{le="5"} 1\n'
+                                                  'tries_bucket{le="+Inf"} 1\n'
+                                                  "tries_sum 3\n"
+                                                  "tries_count 1\n")
+
+    def test_snapshot_writer(self):
+        """
+        Test that the snapshot file is written periodically and once more when closed.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "metrics.json")
+            metrics = Metrics()
+            metrics.exporters.append(SnapshotWriter(metrics, path, interval=3600))
+
+            metrics.inc("games_total")
+            self.assertFalse(os.path.exists(path))
+
+            metrics.close()
+            with open(path) as snapshot:
+                self.assertEqual(json.load(snapshot)["counters"], {"games_total": [{"labels": {}, "value": 1}]})
+
+    def test_metrics_server(self):
+        """
+        Test that the metrics are served on /metrics only.
+        """
+
+        metrics = Metrics()
+        server = MetricsServer(metrics, 0)
+        metrics.exporters.append(server)
+        self.addCleanup(metrics.close)
+
+        metrics.inc("games_total")
+        with urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            self.assertEqual(response.read().decode(), "# TYPE games_total counter\ngames_total 1\n")
+
+        with self.assertRaises(HTTPError):
+            urlopen(f"http://127.0.0.1:{server.port}/other")
+
+    def test_open_metrics_disabled(self):
+        """
+        Test that the disabled metrics are used when no metrics option is given, and do nothing.
+        """
+
+        metrics = open_metrics(SimpleNamespace(metrics_file=None, metrics_interval=10.0, metrics_port=None))
+        self.assertIs(metrics, NULL_METRICS)
+        self.assertFalse(metrics.enabled)
+
+        with metrics, metrics.timer("stage_seconds", stage="read"):
+            metrics.inc("words_total")
+            metrics.observe("tries", 3)
+
+    def test_disabled_metrics_skip_collector(self):
+        """
+        Test that the live metrics module isn't loaded when the metrics are disabled.
+        """
+
+        code = ("import sys\n"
+                "from types import SimpleNamespace\n"
+                "from metrics.metrics import METRICS_DEFAULTS, open_metrics\n"
+                "open_metrics(SimpleNamespace(**METRICS_DEFAULTS))\n"
+                "print('metrics.collector' in sys.modules)\n")
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True)
+
+        self.assertEqual(result.stdout, "False\n", result.stderr)
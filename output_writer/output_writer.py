@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+
+"""
+Output Writer
+-------------
+Shared output layer for the palindrome checker, the calculator and the guessing game.
+
+Instead of calling print once per result, the tools hand their results to an
+OutputWriter, which collects them in a large in-memory buffer and writes them with
+a single call once the buffer is full. Results can be written as:
+
+- plain: the same human readable text the tools always printed
+- jsonl: one JSON object per line
+- csv:   one comma separated row per result, with a header row
+- binary: compact length-prefixed records (see read_binary_records)
+
+Writes can optionally happen in a background thread, so the tool keeps working
+while the operating system is busy with the output.
+
+The modules needed by each format and by the background thread are only imported
+when they are used, to keep the startup of the tools fast.
+"""
+
+# --- Import python libraries
+
+import io
+import sys
+
+# --- Useful global variables
+
+OUTPUT_FORMATS = ("plain", "jsonl", "csv", "binary")
+
+# Values of the output options when they aren't given
+OUTPUT_DEFAULTS = {
+    "output_format": "plain",
+    "output": None,
+    "background_writer": False,
+}
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Binary records: number of fields, then every field as its length and UTF-8 bytes,
+# both little-endian unsigned integers of these sizes
+FIELD_COUNT_SIZE = 2
+FIELD_LENGTH_SIZE = 4
+
+# --- Class definitions
+
+
+class OutputWriter:
+    """
+    Buffered writer for results in a selectable format.
+
+    Add results with write(result, text=None), which is bound to the chosen format
+    when the writer is created so no format check is done per result.
+
+    Results are either plain messages (str) or records (dict). A message is stored
+    under the 'message' key in the structured formats, and a record is written as
+    its tab separated values in plain format unless a text is given for it.
+
+    Args:
+        stream (file | None): Stream to write to, binary or text (default: sys.stdout at creation time).
+        output_format (str): One of 'plain', 'jsonl', 'csv' or 'binary' (default: 'plain').
+        buffer_size (int): Bytes to collect before writing to the stream (default: 1 MiB).
+        background (bool): Write to the stream from a background thread.
+        close_stream (bool): Close the stream when the writer is closed.
+
+    Raises:
+        ValueError: If the format is invalid or binary output is requested on a text stream.
+    """
+
+    def __init__(self, stream=None, output_format: str = "plain", buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 background: bool = False, close_stream: bool = False):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output format provided. Please choose: {', '.join(OUTPUT_FORMATS)}")
+
+        if stream is None:
+            stream = sys.stdout
+
+        # Prefer the binary stream under a text one, flushing the text layer before every
+        # write keeps the order with what the tools still print directly
+        self._text_stream = None
+        if isinstance(stream, io.TextIOBase) and hasattr(stream, "buffer"):
+            self._text_stream = stream
+            stream = stream.buffer
+
+        self.stream = stream
+        self.output_format = output_format
+        self.buffer_size = buffer_size
+        self.close_stream = close_stream
+        self._binary_stream = not isinstance(stream, io.TextIOBase)
+
+        if output_format == "binary" and not self._binary_stream:
+            raise ValueError("Binary output needs a binary stream")
+
+        self._text = io.StringIO()
+        self._bytes = bytearray()
+        self._closed = False
+
+        if output_format == "csv":
+            import csv
+            self._csv = csv.writer(self._text, lineterminator="\n")
+            self._csv_header = None
+
+        elif output_format == "jsonl":
+            import json
+            self._json_dumps = json.dumps
+
+        self.write = {
+            "plain": self._write_plain,
+            "jsonl": self._write_jsonl,
+            "csv": self._write_csv,
+            "binary": self._write_binary,
+        }[output_format]
+
+        self._queue = None
+        self._error = None
+        if background:
+            import queue
+            import threading
+
+            self._queue = queue.Queue(maxsize=8)
+            self._thread = threading.Thread(target=self._background_writer, daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- Formats, each one is installed as self.write(result, text=None)
+
+    def _write_plain(self, result, text: str | None = None) -> None:
+        if text is None:
+            text = result if isinstance(result, str) else "\t".join(str(value) for value in result.values())
+
+        self._text.write(text)
+        self._text.write("\n")
+        if self._text.tell() >= self.buffer_size:
+            self._hand_over()
+
+    def _write_jsonl(self, result, text: str | None = None) -> None:
+        self._text.write(self._json_dumps({"message": result} if isinstance(result, str) else result))
+        self._text.write("\n")
+        if self._text.tell() >= self.buffer_size:
+            self._hand_over()
+
+    def _write_csv(self, result, text: str | None = None) -> None:
+        if isinstance(result, str):
+            result = {"message": result}
+
+        # Write a header row whenever the kind of record changes
+        if self._csv_header != result.keys():
+            self._csv_header = result.keys()
+            self._csv.writerow(self._csv_header)
+
+        self._csv.writerow(result.values())
+        if self._text.tell() >= self.buffer_size:
+            self._hand_over()
+
+    def _write_binary(self, result, text: str | None = None) -> None:
+        values = (result,) if isinstance(result, str) else result.values()
+
+        self._bytes += len(values).to_bytes(FIELD_COUNT_SIZE, "little")
+        for value in values:
+            value = str(value).encode()
+            self._bytes += len(value).to_bytes(FIELD_LENGTH_SIZE, "little")
+            self._bytes += value
+
+        if len(self._bytes) >= self.buffer_size:
+            self._hand_over()
+
+    def write_many(self, results) -> None:
+        """
+        Write several results.
+
+        Args:
+            results (iterable): Messages or records to write.
+        """
+        write = self.write
+        for result in results:
+            write(result)
+
+    # --- Buffer handling
+
+    def _hand_over(self) -> None:
+        """Send the buffered output to the stream, or to the background thread."""
+        if self.output_format == "binary":
+            chunk = bytes(self._bytes)
+            self._bytes.clear()
+        else:
+            chunk = self._text.getvalue()
+            self._text.seek(0)
+            self._text.truncate()
+            if self._binary_stream:
+                chunk = chunk.encode()
+
+        if not chunk:
+            return
+
+        if self._text_stream:
+            self._text_stream.flush()
+
+        if self._queue is None:
+            self.stream.write(chunk)
+            return
+
+        if self._error:
+            raise self._error
+        self._queue.put(chunk)
+
+    def _background_writer(self) -> None:
+        """Write the chunks received from the main thread until the writer is closed."""
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is None:
+                    return
+                if not self._error:
+                    self.stream.write(chunk)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """Write everything buffered so far and flush the stream."""
+        self._hand_over()
+
+        if self._queue is not None:
+            self._queue.join()
+            if self._error:
+                raise self._error
+
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Flush the writer, stop the background thread and close the stream if owned."""
+        if self._closed:
+            return
+        self._closed = True
+
+        try:
+            self.flush()
+        finally:
+            if self._queue is not None:
+                self._queue.put(None)
+                self._thread.join()
+            if self.close_stream:
+                self.stream.close()
+
+
+# --- Method definitions
+
+def read_binary_records(data: bytes) -> list[list[str]]:
+    """
+    Decode the records written in binary format.
+
+    Args:
+        data (bytes): Output written by an OutputWriter in binary format.
+
+    Returns:
+        list[list[str]]: Fields of every record.
+    """
+    records = []
+    position = 0
+
+    while position < len(data):
+        count = int.from_bytes(data[position:position + FIELD_COUNT_SIZE], "little")
+        position += FIELD_COUNT_SIZE
+
+        fields = []
+        for _ in range(count):
+            length = int.from_bytes(data[position:position + FIELD_LENGTH_SIZE], "little")
+            position += FIELD_LENGTH_SIZE
+            fields.append(data[position:position + length].decode())
+            position += length
+
+        records.append(fields)
+
+    return records
+
+def add_output_arguments(parser) -> None:
+    """
+    Add the output options shared by all the tools to an argument parser.
+
+    Args:
+        parser (ArgumentParser): Parser to add the options to.
+    """
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default=OUTPUT_DEFAULTS["output_format"],
+        help="Format of the results (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default=OUTPUT_DEFAULTS["output"],
+        help="Write the results to this file instead of the terminal"
+    )
+    parser.add_argument(
+        "--background-writer",
+        action="store_true",
+        help="Write the results from a background thread"
+    )
+
+def open_output(args) -> OutputWriter:
+    """
+    Create the output writer selected by the shared output options.
+
+    Args:
+        args (Namespace): Parsed arguments with the options of add_output_arguments.
+
+    Returns:
+        OutputWriter: Writer to the selected file, or to the terminal.
+
+    Raises:
+        OSError: If the output file can't be opened.
+    """
+    if args.output:
+        return OutputWriter(open(args.output, "wb"), args.output_format,
+                            background=args.background_writer, close_stream=True)
+
+    return OutputWriter(None, args.output_format, background=args.background_writer)
@@ -0,0 +1,109 @@
+# --- Import required python libraries
+import io
+import json
+import unittest
+
+# --- Import the functions to be tested
+from output_writer.output_writer import OutputWriter, read_binary_records
+
+class TestOutputWriter(unittest.TestCase):
+    """
+    Unit tests for the output_writer module.
+    Tests every output format, the buffering and the background writer.
+    """
+
+    def test_plain_format(self):
+        """
+        Test that plain format writes messages, given texts and tab separated records.
+        """
+
+        stream = io.StringIO()
+        with OutputWriter(stream) as output:
+            output.write("Found palindromes:")
+            output.write({"palindrome": "level"}, text="\tlevel")
+            output.write({"word": "noon", "count": 2})
+
+        self.assertEqual(stream.getvalue(), "Found palindromes:\n\tlevel\nnoon\t2\n")
+
+    def test_jsonl_format(self):
+        """
+        Test that jsonl format writes one JSON object per result.
+        """
+
+        stream = io.StringIO()
+        with OutputWriter(stream, "jsonl") as output:
+            output.write("hello")
+            output.write({"palindrome": "level"}, text="\tlevel")
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(lines, [{"message": "hello"}, {"palindrome": "level"}])
+
+    def test_csv_format(self):
+        """
+        Test that csv format writes a header row for every kind of record.
+        """
+
+        stream = io.StringIO()
+        with OutputWriter(stream, "csv") as output:
+            output.write_many([{"palindrome": "level"}, {"palindrome": "a,b"}])
+            output.write("done")
+
+        self.assertEqual(stream.getvalue(), 'palindrome\nlevel\n"a,b"\nmessage\ndone\n')
+
+    def test_binary_format(self):
+        """
+        Test that binary format records are read back by read_binary_records.
+        """
+
+        stream = io.BytesIO()
+        with OutputWriter(stream, "binary") as output:
+            output.write({"word": "ñandú", "count": 3})
+            output.write("done")
+
+        self.assertEqual(read_binary_records(stream.getvalue()), [["ñandú", "3"], ["done"]])
+
+    def test_binary_format_text_stream(self):
+        """
+        Test that binary format on a text stream raises ValueError.
+        """
+
+        with self.assertRaises(ValueError):
+            OutputWriter(io.StringIO(), "binary")
+
+    def test_invalid_format(self):
+        """
+        Test that an unknown format raises ValueError.
+        """
+
+        with self.assertRaises(ValueError):
+            OutputWriter(io.StringIO(), "xml")
+
+    def test_output_is_buffered(self):
+        """
+        Test that nothing is written until the buffer is full or flushed.
+        """
+
+        stream = io.BytesIO()
+        output = OutputWriter(stream, buffer_size=20)
+
+        output.write("short")
+        self.assertEqual(stream.getvalue(), b"")
+
+        output.write("a longer message")
+        self.assertEqual(stream.getvalue(), b"short\na longer message\n")
+
+        output.write("last")
+        output.close()
+        self.assertTrue(stream.getvalue().endswith(b"last\n"))
+
+    def test_background_writer(self):
+        """
+        Test that the background writer keeps the order of many results.
+        """
+
+        stream = io.BytesIO()
+        with OutputWriter(stream, "plain", buffer_size=64, background=True) as output:
+            for number in range(10000):
+                output.write(str(number))
+
+        self.assertEqual(stream.getvalue().decode().splitlines(), [str(number) for number in range(10000)])
@@ -0,0 +1,16 @@
+"""
+Entry point for `python -m palindrome_checker`.
+
+Usage:
+    python -m palindrome_checker <input_file> [options] [--startup-profile]
+"""
+
+import sys
+
+if "--startup-profile" in sys.argv[1:]:
+    from startup_profile.startup_profile import profile_startup
+    sys.exit(profile_startup("palindrome_checker", sys.argv[1:]))
+
+from palindrome_checker.checker import main
+
+main()
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+
+"""
+Checks which words of an input file are palindromes, and writes them to the
+terminal or to the selected output.
+
+This is the code of the palindrome_checker.py script and of `python -m palindrome_checker`.
+Python caches the bytecode of imported modules but compiles a script again on every
+run, so the script only imports main from here.
+"""
+
+# --- Import required librarties
+import os
+import sys
+
+from output_writer.output_writer import OUTPUT_DEFAULTS, add_output_arguments, open_output
+from metrics.metrics import METRICS_DEFAULTS, NULL_METRICS, add_metrics_arguments, open_metrics
+
+# --- Useful global variables
+
+# Same class as types.SimpleNamespace, which types.py defines this way. Importing types
+# costs the script about half a millisecond, python -m has it loaded already
+SimpleNamespace = type(sys.implementation)
+
+# Values of the options when they aren't given, also used as the build_parser defaults
+DEFAULT_OPTIONS = {
+    "follow": False,
+    "state_file": None,
+    "poll_interval": 1.0,
+    "count": False,
+    "top": None,
+    "max_checked": 1_000_000,
+    "sketch_memory": None,
+    **OUTPUT_DEFAULTS,
+    **METRICS_DEFAULTS,
+}
+
+# Switches parsed without argparse when they come alone with the input file
+FAST_SWITCHES = {"-f": "follow", "--follow": "follow", "-c": "count", "--count": "count"}
+
+# Metrics of the read, normalize, check and emit stages
+STAGE_SECONDS = "palindrome_checker_stage_seconds"
+STAGE_ITEMS = "palindrome_checker_stage_items_total"
+
+# --- Method Definitions
+
+def build_parser():
+    """
+    Build the command-line parser for the palindrome checker.
+
+    Returns:
+        ArgumentParser: Parser for the input file, mode and output settings.
+    """
+    import argparse
+    from startup_profile.startup_profile import add_startup_profile_argument
+
+    parser = argparse.ArgumentParser(description="Find the palindromes in a list of words")
+    parser.add_argument("input_file", help="Text file with one word per line")
+    parser.add_argument(
+        "-f", "--follow",
+        action="store_true",
+        help="Keep checking the lines appended to the file until interrupted"
+    )
+    parser.add_argument(
+        "--state-file",
+        help="File to save the position reached in follow mode (default: <input_file>.offset)"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        help="Maximum seconds between checks of the file in follow mode (default: %(default)s)"
+    )
+    parser.add_argument(
+        "-c", "--count",
+        action="store_true",
+        help="Write each distinct palindrome once with its number of occurrences"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        help="In count mode, only write the K most frequent palindromes"
+    )
+    parser.add_argument(
+        "--max-checked",
+        type=int,
+        help="In count mode, most distinct words remembered as checked (default: %(default)s). "
+             "The exact counts themselves grow with the distinct palindromes"
+    )
+    parser.add_argument(
+        "--sketch-memory",
+        type=float,
+        help="In count mode, use a Bloom filter and count-min sketch of this many MiB "
+             "instead of exact counts, keeping the top K palindromes (default K: 100)"
+    )
+    add_output_arguments(parser)
+    add_metrics_arguments(parser)
+    add_startup_profile_argument(parser)
+    parser.set_defaults(**DEFAULT_OPTIONS)
+    return parser
+
+def parse_arguments():
+    """
+    Parse command-line arguments for the palindrome checker.
+
+    When only the input file is given, the most common call from shell pipelines,
+    or the input file and one of the follow or count switches, the options are set
+    without importing argparse.
+
+    Returns:
+        Namespace: Parsed arguments with the input file and output settings.
+    """
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        return SimpleNamespace(input_file=sys.argv[1], **DEFAULT_OPTIONS)
+
+    if len(sys.argv) == 3:
+        first, second = sys.argv[1:]
+        input_file, switch = (second, first) if first.startswith("-") else (first, second)
+        if switch in FAST_SWITCHES and not input_file.startswith("-"):
+            return SimpleNamespace(**{**DEFAULT_OPTIONS, "input_file": input_file, FAST_SWITCHES[switch]: True})
+
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.top is not None and args.top < 1:
+        parser.error("--top must be at least 1")
+
+    if args.max_checked < 1:
+        parser.error("--max-checked must be at least 1")
+
+    if args.sketch_memory is not None:
+        try:
+            from .palindrome_counter import MIN_SKETCH_MEMORY
+        except ImportError:
+            from palindrome_counter import MIN_SKETCH_MEMORY
+
+        if args.sketch_memory * 1024 * 1024 < MIN_SKETCH_MEMORY:
+            parser.error(f"--sketch-memory must be at least {MIN_SKETCH_MEMORY / 1024 / 1024:g} MiB")
+
+    return args
+
+def get_input_data(input_file: str | None = None, metrics=NULL_METRICS) -> list:
+    """
+    Get the data from the file provided though command line arguments.
+
+    Args:
+        input_file (str | None): File to read, defaults to the first command line argument.
+        metrics (Metrics | NullMetrics): Metrics for the read and normalize stages (default: disabled).
+
+    Returns:
+        list: words imported from input file
+    """    
+
+    try:
+        if input_file is None:
+            input_file = sys.argv[1]
+        
+        # read provided input file
+        if not metrics.enabled:
+            with open(input_file, "r") as tmp:
+                input_data = clean_words(tmp)
+
+        else:
+            # Read all the lines first to time reading and cleaning separately
+            with open(input_file, "r") as tmp, metrics.timer(STAGE_SECONDS, stage="read"):
+                lines = tmp.readlines()
+
+            with metrics.timer(STAGE_SECONDS, stage="normalize"):
+                input_data = clean_words(lines)
+
+            metrics.inc(STAGE_ITEMS, len(lines), stage="read")
+            metrics.inc(STAGE_ITEMS, len(input_data), stage="normalize")
+
+    except Exception as e:
+        print(f"Error reading input file:\n\t{e}")
+        sys.exit(1)
+
+    return input_data
+
+def clean_words(lines) -> list:
+    """
+    Remove the whitespace of every line and drop the empty ones.
+
+    Args:
+        lines (iterable): Lines read from the input
+
+    Returns:
+        list: cleaned words
+    """
+
+    return [line.strip().replace(" ", "") for line in lines if line.strip()]
+
+def reverse_word_pairing (input_words: list) -> list:
+    """
+    Return a list of tuples containing the input word and the reversed words
+
+    Args:
+        input_words (list): Words to invert
+
+    Returns:
+        list: inverted words
+    """    
+
+    return [(word, word[::-1]) for word in input_words]
+
+def get_palindromes(word_pairs:list) -> list:
+    """
+    Identify palindromes.
+
+    Args:
+        word_pairs (list): List of word, inverted_word pairs to analyze
+
+    Returns:
+        list: palindromes found
+    """
+
+    return [word for word, reversed_word in word_pairs if word == reversed_word]
+
+def main(print_palindromes:bool=True) -> list:
+    """
+    Execute the main flow of the script.
+
+    Args:
+        print_palindromes (bool, optional): If True, prints found palindromes to the terminal. Defaults to True.
+
+    Returns:
+        list: List of palindromes found in the input file or provided list.
+              Empty in follow mode, where palindromes are written as they are found.
+              (palindrome, count) pairs, most frequent first, in count mode.
+    """
+
+    # Verify arguments were provided
+    if len(sys.argv) < 2:
+        print("Usage: python palindrome_checker.py <input_file>")
+        sys.exit(1)
+
+    args = parse_arguments()
+
+    try:
+        metrics = open_metrics(args)
+    except OSError as e:
+        print(f"Error starting the metrics:\n\t{e}")
+        sys.exit(1)
+
+    with metrics:
+        if args.follow:
+            return follow_input_file(args, metrics)
+
+        if args.count:
+            return count_input_file(args, print_palindromes, metrics)
+
+        return check_input_file(args, print_palindromes, metrics)
+
+def check_input_file(args, print_palindromes: bool = True, metrics=NULL_METRICS) -> list:
+    """
+    Find the palindromes of the input file.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        print_palindromes (bool, optional): If True, writes the palindromes found. Defaults to True.
+        metrics (Metrics | NullMetrics): Metrics for every stage (default: disabled).
+
+    Returns:
+        list: Palindromes found in the input file.
+    """
+
+    read_words = get_input_data(args.input_file, metrics)
+
+    with metrics.timer(STAGE_SECONDS, stage="check"):
+        word_pairs = reverse_word_pairing(read_words)
+
+        palindromes = get_palindromes(word_pairs)
+
+    metrics.inc(STAGE_ITEMS, len(read_words), stage="check")
+
+    # Show palindromes in terminal or in the selected output
+    if print_palindromes:
+        try:
+            output = open_output(args)
+        except OSError as e:
+            print(f"Error opening output file:\n\t{e}")
+            sys.exit(1)
+
+        with metrics.timer(STAGE_SECONDS, stage="emit"), output:
+            if output.output_format == "plain":
+                output.write("Found palindromes:")
+            for word in palindromes:
+                output.write({"palindrome": word}, text=f"\t{word}")
+
+        metrics.inc(STAGE_ITEMS, len(palindromes), stage="emit")
+
+    return palindromes
+
+def count_input_file(args, print_palindromes: bool = True, metrics=NULL_METRICS) -> list:
+    """
+    Count the occurrences of each distinct palindrome of the input file.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        print_palindromes (bool, optional): If True, writes the counted palindromes. Defaults to True.
+        metrics (Metrics | NullMetrics): Metrics for every stage (default: disabled).
+
+    Returns:
+        list: (palindrome, count) pairs, most frequent first.
+    """
+
+    # Only needed in count mode
+    try:
+        from .palindrome_counter import PalindromeCounter, SketchPalindromeCounter, count_palindromes
+    except ImportError:
+        from palindrome_counter import PalindromeCounter, SketchPalindromeCounter, count_palindromes
+
+    if args.sketch_memory is not None:
+        counter = SketchPalindromeCounter(int(args.sketch_memory * 1024 * 1024), 100 if args.top is None else args.top)
+    else:
+        counter = PalindromeCounter(args.max_checked)
+
+    count_palindromes(args.input_file, counter, metrics)
+
+    # Ranking the counted palindromes is part of the check stage
+    with metrics.timer(STAGE_SECONDS, stage="check"):
+        palindromes = counter.most_common(args.top)
+
+    if print_palindromes:
+        try:
+            output = open_output(args)
+        except OSError as e:
+            print(f"Error opening output file:\n\t{e}")
+            sys.exit(1)
+
+        with metrics.timer(STAGE_SECONDS, stage="emit"), output:
+            if output.output_format == "plain":
+                output.write(f"Found {counter.distinct} distinct palindromes:")
+            for word, count in palindromes:
+                output.write({"palindrome": word, "count": count}, text=f"\t{word}: {count}")
+
+        metrics.inc(STAGE_ITEMS, len(palindromes), stage="emit")
+
+    return palindromes
+
+def follow_input_file(args, metrics=NULL_METRICS) -> list:
+    """
+    Write the palindromes appended to the input file until interrupted.
+
+    Args:
+        args (Namespace): Parsed command-line arguments.
+        metrics (Metrics | NullMetrics): Metrics for every stage (default: disabled).
+
+    Returns:
+        list: Empty list, palindromes are written as they are found.
+    """
+
+    # Only needed in follow mode
+    try:
+        from .follow_mode import follow
+    except ImportError:
+        from follow_mode import follow
+
+    if not os.path.isfile(args.input_file):
+        print(f"Error reading input file:\n\tNo such file: '{args.input_file}'")
+        sys.exit(1)
+
+    try:
+        output = open_output(args)
+    except OSError as e:
+        print(f"Error opening output file:\n\t{e}")
+        sys.exit(1)
+
+    with output:
+        if output.output_format == "plain":
+            output.write("Found palindromes:")
+
+        try:
+            follow(args.input_file, output, args.state_file, args.poll_interval, metrics=metrics)
+        except KeyboardInterrupt:
+            pass
+
+    return []
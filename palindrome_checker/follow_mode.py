@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+
+"""
+Follow mode for the palindrome checker.
+
+Keeps checking a file that is continuously appended to, like `tail -f`. Only the
+lines added since the last check are read, and the position reached in the file is
+saved in a state file, so a restarted checker continues where it stopped.
+
+Changes are detected with inotify on Linux, and by checking the file size every
+poll interval everywhere else.
+"""
+
+# --- Import required librarties
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import sys
+import time
+
+try:
+    from .checker import clean_words, reverse_word_pairing, get_palindromes
+    from .checker import NULL_METRICS, STAGE_SECONDS, STAGE_ITEMS
+except ImportError:
+    from checker import clean_words, reverse_word_pairing, get_palindromes
+    from checker import NULL_METRICS, STAGE_SECONDS, STAGE_ITEMS
+
+# --- Useful global variables
+
+# inotify events for a file being written, replaced or removed (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVE_SELF = 0x00000800
+IN_DELETE_SELF = 0x00000400
+WATCHED_EVENTS = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVE_SELF | IN_DELETE_SELF
+
+# Most bytes read at once, so a large backlog is processed in pieces. Longer lines
+# can't be words and are skipped.
+MAX_READ_SIZE = 8 * 1024 * 1024
+
+# --- Class Definitions
+
+class FileWatcher:
+    """
+    Wait for changes in a file, with inotify when available or by polling its size.
+
+    Args:
+        path (str): File to watch
+        use_inotify (bool, optional): Try to use inotify. Defaults to True.
+    """
+
+    def __init__(self, path: str, use_inotify: bool = True):
+        self.path = path
+        self._fd = None
+        self._last_stat = None
+
+        if use_inotify and sys.platform.startswith("linux"):
+            self._fd = self._start_inotify(path)
+
+    @staticmethod
+    def _start_inotify(path: str) -> int | None:
+        """
+        Start an inotify watch on the file.
+
+        Args:
+            path (str): File to watch
+
+        Returns:
+            int | None: inotify file descriptor, None if inotify isn't available
+        """
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+
+        if fd < 0:
+            return None
+
+        if libc.inotify_add_watch(fd, os.fsencode(path), WATCHED_EVENTS) < 0:
+            os.close(fd)
+            return None
+
+        return fd
+
+    @property
+    def uses_inotify(self) -> bool:
+        """True if changes are detected with inotify."""
+        return self._fd is not None
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait until the file changes or the timeout expires.
+
+        Args:
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            bool: True if a change was detected
+        """
+
+        if self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if not ready:
+                return False
+
+            # Drain the pending events, one wake up is enough for any amount of changes
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+            return True
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                stat = os.stat(self.path)
+                current = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            except FileNotFoundError:
+                current = None
+
+            if current != self._last_stat:
+                self._last_stat = current
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, 0.05))
+
+    def close(self) -> None:
+        """Stop watching the file."""
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+# --- Method Definitions
+
+def load_state(state_file: str) -> tuple[int | None, int]:
+    """
+    Read the position saved by a previous run.
+
+    Args:
+        state_file (str): File with the saved position
+
+    Returns:
+        tuple: (inode of the followed file or None, offset of the first unread byte)
+    """
+
+    try:
+        with open(state_file, "r") as tmp:
+            state = json.load(tmp)
+        return state["inode"], state["offset"]
+
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, 0
+
+def save_state(state_file: str, inode: int, offset: int) -> None:
+    """
+    Save the position reached in the followed file.
+
+    Args:
+        state_file (str): File to save the position to
+        inode (int): Inode of the followed file, to notice when it is replaced
+        offset (int): Offset of the first unread byte
+    """
+
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, "w") as tmp:
+        json.dump({"inode": inode, "offset": offset}, tmp)
+
+    # Replace the state in one step so a crash never leaves a half written file
+    os.replace(tmp_file, state_file)
+
+def read_new_lines(input_file: str, offset: int, max_size: int = MAX_READ_SIZE,
+                   skip_line: bool = False) -> tuple[list, int, bool]:
+    """
+    Read the complete lines added to the file after the offset.
+
+    A last line without its line break is left for the next read, since it may
+    still be being written. A line longer than max_size is skipped instead, so it
+    can't stall the reads: the bytes read are dropped and the next reads drop the
+    rest of the line with skip_line.
+
+    Args:
+        input_file (str): File to read
+        offset (int): Offset of the first unread byte
+        max_size (int, optional): Most bytes to read. Defaults to MAX_READ_SIZE.
+        skip_line (bool, optional): The offset is inside a skipped line, drop the bytes up
+            to its line break. Defaults to False.
+
+    Returns:
+        tuple: (new lines, offset after the bytes used, True if the offset is inside a skipped line)
+    """
+
+    with open(input_file, "rb") as tmp:
+        tmp.seek(offset)
+        data = tmp.read(max_size)
+
+    if skip_line:
+        end = data.find(b"\n") + 1
+        if end == 0:
+            return [], offset + len(data), True
+        return [], offset + end, False
+
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        if len(data) == max_size:
+            # A line longer than anything read at once
+            return [], offset + len(data), True
+        return [], offset, False
+
+    return data[:end].decode(errors="replace").splitlines(), offset + end, False
+
+def follow(input_file: str, output, state_file: str | None = None, poll_interval: float = 1.0,
+           stop_event=None, use_inotify: bool = True, metrics=NULL_METRICS) -> None:
+    """
+    Write the palindromes of the lines appended to a file as soon as they are added.
+
+    The file is read from the position saved in the state file, or from the start if
+    there is none. If the file is replaced or truncated it is read again from the start.
+
+    Args:
+        input_file (str): File to follow
+        output (OutputWriter): Writer for the palindromes found
+        state_file (str | None, optional): File to save the position to. Defaults to input_file + ".offset".
+        poll_interval (float, optional): Maximum seconds between checks. Defaults to 1.0.
+        stop_event (threading.Event | None, optional): Stop following once set. Defaults to None (until interrupted).
+        use_inotify (bool, optional): Use inotify when available. Defaults to True.
+        metrics (Metrics | NullMetrics, optional): Metrics for every stage. Defaults to NULL_METRICS (disabled).
+    """
+
+    if state_file is None:
+        state_file = f"{input_file}.offset"
+
+    inode, offset = load_state(state_file)
+    watcher = FileWatcher(input_file, use_inotify)
+
+    # Start of the line being skipped for being too long, saved as the position so a
+    # restarted follow skips it again instead of reading its end as a line
+    long_line_start = None
+
+    try:
+        while stop_event is None or not stop_event.is_set():
+            try:
+                stat = os.stat(input_file)
+            except FileNotFoundError:
+                # Wait for a rotated file to be created again
+                watcher.wait(poll_interval)
+                continue
+
+            if stat.st_ino != inode:
+                # A different file than the one followed so far, watch it from the start
+                if inode is not None:
+                    watcher.close()
+                    watcher = FileWatcher(input_file, use_inotify)
+                inode, offset, long_line_start = stat.st_ino, 0, None
+
+            elif stat.st_size < offset:
+                # The file was truncated
+                offset, long_line_start = 0, None
+
+            with metrics.timer(STAGE_SECONDS, stage="read"):
+                lines, new_offset, in_long_line = read_new_lines(input_file, offset, MAX_READ_SIZE,
+                                                                 long_line_start is not None)
+
+            if new_offset != offset:
+                with metrics.timer(STAGE_SECONDS, stage="normalize"):
+                    words = clean_words(lines)
+
+                with metrics.timer(STAGE_SECONDS, stage="check"):
+                    palindromes = get_palindromes(reverse_word_pairing(words))
+
+                with metrics.timer(STAGE_SECONDS, stage="emit"):
+                    for word in palindromes:
+                        output.write({"palindrome": word}, text=f"\t{word}")
+                    output.flush()
+
+                metrics.inc(STAGE_ITEMS, len(lines), stage="read")
+                metrics.inc(STAGE_ITEMS, len(words), stage="normalize")
+                metrics.inc(STAGE_ITEMS, len(words), stage="check")
+                metrics.inc(STAGE_ITEMS, len(palindromes), stage="emit")
+
+                if in_long_line and long_line_start is None:
+                    long_line_start = offset
+                elif not in_long_line:
+                    long_line_start = None
+
+                offset = new_offset
+                save_state(state_file, inode, offset if long_line_start is None else long_line_start)
+
+                # Keep reading without waiting while there is a backlog
+                if offset < stat.st_size:
+                    continue
+
+            watcher.wait(poll_interval)
+
+    finally:
+        watcher.close()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+
+"""
+Counting mode for the palindrome checker.
+
+Instead of writing every palindrome each time it appears, the words are counted and
+each distinct palindrome is written once with its number of occurrences. Words are
+read in chunks, so inputs of any size can be counted, and each distinct word of a
+chunk is only checked once.
+
+Two counters are available:
+
+- PalindromeCounter: exact counts. Remembers whether the words it already checked
+  are palindromes, up to a configurable amount of words. The counts themselves are
+  not bounded: their memory grows with the number of distinct palindromes.
+- SketchPalindromeCounter: fixed memory. Counts with a count-min sketch, which can
+  overestimate but never underestimates, estimates the distinct palindromes with a
+  Bloom filter, and keeps only the top K palindromes. It doesn't remember the words
+  checked in earlier chunks: comparing a word with its reverse is cheaper than the
+  hashes a Bloom filter lookup needs, so each distinct word is checked once per chunk.
+"""
+
+# --- Import required librarties
+import hashlib
+import sys
+from array import array
+from collections import Counter
+from itertools import islice
+
+try:
+    from .checker import clean_words, NULL_METRICS, STAGE_SECONDS, STAGE_ITEMS
+except ImportError:
+    from checker import clean_words, NULL_METRICS, STAGE_SECONDS, STAGE_ITEMS
+
+# --- Useful global variables
+
+# Lines read and counted at once
+CHUNK_SIZE = 100_000
+
+# Smallest memory of the sketch counter, 1024 counters per count-min sketch row with
+# the default 4 hashes. Narrower rows make most words collide
+MIN_SKETCH_MEMORY = 64 * 1024
+
+# --- Class Definitions
+
+class PalindromeCounter:
+    """
+    Exact palindrome counter.
+
+    Only the words remembered as checked are bounded, the counts keep every distinct
+    palindrome. Use SketchPalindromeCounter for a fixed amount of memory.
+
+    Args:
+        max_checked (int, optional): Most distinct words to remember as checked, words
+            beyond it are checked again when they appear in a later chunk. Defaults to 1_000_000.
+    """
+
+    def __init__(self, max_checked: int = 1_000_000):
+        self.max_checked = max_checked
+        self.counts = Counter()
+        self._checked = {}
+
+    def add_words(self, words: list) -> None:
+        """
+        Count the palindromes of a chunk of words.
+
+        Args:
+            words (list): Cleaned words
+        """
+
+        checked = self._checked
+        counts = self.counts
+
+        for word, count in Counter(words).items():
+            is_palindrome = checked.get(word)
+
+            if is_palindrome is None:
+                is_palindrome = word == word[::-1]
+                if len(checked) < self.max_checked:
+                    checked[word] = is_palindrome
+
+            if is_palindrome:
+                counts[word] += count
+
+    @property
+    def distinct(self) -> int:
+        """Number of distinct palindromes found."""
+        return len(self.counts)
+
+    def most_common(self, k: int | None = None) -> list:
+        """
+        Get the most frequent palindromes.
+
+        Args:
+            k (int | None, optional): Amount of palindromes, all of them if None. Defaults to None.
+
+        Returns:
+            list: (palindrome, count) pairs, most frequent first
+        """
+
+        return self.counts.most_common(k)
+
+
+class BloomFilter:
+    """
+    Set membership with a fixed memory size and no false negatives.
+
+    Args:
+        size_bits (int): Bits of the filter
+        hashes (int): Bit positions set per item
+    """
+
+    def __init__(self, size_bits: int, hashes: int):
+        self.size_bits = max(size_bits, 8)
+        self.hashes = hashes
+        self.bits = bytearray(self.size_bits // 8)
+        self.size_bits = len(self.bits) * 8
+
+    def add(self, h1: int, h2: int) -> bool:
+        """
+        Add an item given its two hashes.
+
+        Args:
+            h1 (int): First hash of the item
+            h2 (int): Second hash of the item
+
+        Returns:
+            bool: True if the item was probably already present
+        """
+
+        present = True
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % self.size_bits
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                present = False
+                self.bits[byte] |= 1 << bit
+
+        return present
+
+
+class CountMinSketch:
+    """
+    Frequency estimates with a fixed memory size, never lower than the true counts.
+
+    Args:
+        width (int): Counters per row
+        depth (int): Rows, each one indexed by a different hash
+    """
+
+    def __init__(self, width: int, depth: int):
+        self.width = max(width, 1)
+        self.depth = depth
+        self.rows = [array("Q", [0]) * self.width for _ in range(depth)]
+
+    def add(self, h1: int, h2: int, count: int = 1) -> int:
+        """
+        Add occurrences of an item given its two hashes.
+
+        Args:
+            h1 (int): First hash of the item
+            h2 (int): Second hash of the item
+            count (int, optional): Occurrences to add. Defaults to 1.
+
+        Returns:
+            int: New frequency estimate of the item
+        """
+
+        estimate = None
+        for i, row in enumerate(self.rows):
+            position = (h1 + i * h2) % self.width
+            row[position] += count
+            if estimate is None or row[position] < estimate:
+                estimate = row[position]
+
+        return estimate
+
+
+class SketchPalindromeCounter:
+    """
+    Palindrome counter using a fixed amount of memory.
+
+    Each distinct word of a chunk is checked once, words repeated in later chunks
+    are checked again since only palindromes are hashed.
+
+    Args:
+        memory_bytes (int): Memory shared by the Bloom filter and the count-min sketch
+        top_k (int, optional): Most frequent palindromes to keep. Defaults to 100.
+        hashes (int, optional): Hashes per word in both structures. Defaults to 4.
+
+    Raises:
+        ValueError: If the memory is below MIN_SKETCH_MEMORY or top_k is below 1.
+    """
+
+    def __init__(self, memory_bytes: int, top_k: int = 100, hashes: int = 4):
+        if memory_bytes < MIN_SKETCH_MEMORY:
+            raise ValueError(f"The sketch counter needs at least {MIN_SKETCH_MEMORY} bytes of memory")
+        if top_k < 1:
+            raise ValueError("The sketch counter must keep at least one palindrome")
+
+        self.top_k = top_k
+        self.bloom = BloomFilter(memory_bytes // 2 * 8, hashes)
+        self.sketch = CountMinSketch(memory_bytes // 2 // (hashes * 8), hashes)
+        self.distinct = 0
+        self._top = {}
+        self._top_min = None
+
+    @staticmethod
+    def _hashes(word: str) -> tuple[int, int]:
+        """Two independent 64-bit hashes of a word, stable across runs."""
+        digest = hashlib.blake2b(word.encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def add_words(self, words: list) -> None:
+        """
+        Count the palindromes of a chunk of words.
+
+        Args:
+            words (list): Cleaned words
+        """
+
+        for word, count in Counter(words).items():
+            if word != word[::-1]:
+                continue
+
+            h1, h2 = self._hashes(word)
+            if not self.bloom.add(h1, h2):
+                self.distinct += 1
+
+            self._update_top(word, self.sketch.add(h1, h2, count))
+
+    def _update_top(self, word: str, estimate: int) -> None:
+        """Keep the word if it is among the top K estimates."""
+
+        top = self._top
+        if word in top or len(top) < self.top_k:
+            top[word] = estimate
+        elif estimate > top[self._top_min]:
+            del top[self._top_min]
+            top[word] = estimate
+        else:
+            return
+
+        if self._top_min not in top or top[word] < top[self._top_min] or self._top_min == word:
+            self._top_min = min(top, key=top.get)
+
+    def most_common(self, k: int | None = None) -> list:
+        """
+        Get the most frequent palindromes.
+
+        Args:
+            k (int | None, optional): Amount of palindromes, up to top_k. Defaults to None (top_k).
+
+        Returns:
+            list: (palindrome, estimated count) pairs, most frequent first
+        """
+
+        return sorted(self._top.items(), key=lambda item: item[1], reverse=True)[:k]
+
+# --- Method Definitions
+
+def iter_word_chunks(input_file: str, chunk_size: int = CHUNK_SIZE, metrics=NULL_METRICS):
+    """
+    Read the cleaned words of a file in chunks.
+
+    Args:
+        input_file (str): File to read
+        chunk_size (int, optional): Lines per chunk. Defaults to CHUNK_SIZE.
+        metrics (Metrics | NullMetrics): Metrics for the read and normalize stages (default: disabled).
+
+    Yields:
+        list: cleaned words of each chunk
+    """
+
+    with open(input_file, "r") as tmp:
+        while True:
+            with metrics.timer(STAGE_SECONDS, stage="read"):
+                lines = list(islice(tmp, chunk_size))
+
+            if not lines:
+                return
+
+            with metrics.timer(STAGE_SECONDS, stage="normalize"):
+                words = clean_words(lines)
+
+            metrics.inc(STAGE_ITEMS, len(lines), stage="read")
+            metrics.inc(STAGE_ITEMS, len(words), stage="normalize")
+            yield words
+
+def count_palindromes(input_file: str, counter, metrics=NULL_METRICS) -> None:
+    """
+    Count the palindromes of a file.
+
+    Args:
+        input_file (str): File to read
+        counter (PalindromeCounter | SketchPalindromeCounter): Counter to add the words to
+        metrics (Metrics | NullMetrics): Metrics for the read, normalize and check stages (default: disabled).
+    """
+
+    try:
+        for words in iter_word_chunks(input_file, metrics=metrics):
+            with metrics.timer(STAGE_SECONDS, stage="check"):
+                counter.add_words(words)
+
+            metrics.inc(STAGE_ITEMS, len(words), stage="check")
+
+    except Exception as e:
+        print(f"Error reading input file:\n\t{e}")
+        sys.exit(1)
@@ -0,0 +1,177 @@
+# --- Import required python libraries
+import unittest
+from   unittest import mock
+import tempfile
+import threading
+import time
+import io
+import os
+
+# --- Import the functions to be tested
+from palindrome_checker.follow_mode import FileWatcher, load_state, save_state, read_new_lines, follow
+from output_writer.output_writer import OutputWriter
+
+class TestFollowMode(unittest.TestCase):
+    """
+    Unit tests for the follow_mode module functions.
+    Tests incremental reads, the saved position and following a growing file.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary directory with the followed file and its state file.
+        """
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.input_file = os.path.join(tmp_dir.name, "words.txt")
+        self.state_file = os.path.join(tmp_dir.name, "words.txt.offset")
+
+    def append(self, text: str, mode: str = "a") -> None:
+        """
+        Append text to the followed file.
+        """
+
+        with open(self.input_file, mode) as tmp:
+            tmp.write(text)
+
+    def start_follow(self, use_inotify: bool = True) -> tuple:
+        """
+        Follow the file in a background thread until stopped or the end of the test.
+        """
+
+        stream = io.StringIO()
+        stop_event = threading.Event()
+        thread = threading.Thread(target=follow,
+                                  args=(self.input_file, OutputWriter(stream, "plain"), self.state_file, 0.05,
+                                        stop_event, use_inotify))
+        thread.start()
+
+        def stop():
+            stop_event.set()
+            thread.join()
+
+        self.addCleanup(stop)
+        return stream, stop
+
+    def wait_for_output(self, stream: io.StringIO, expected: str) -> None:
+        """
+        Wait until the followed palindromes match the expected output.
+        """
+
+        deadline = time.monotonic() + 5
+        while stream.getvalue() != expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(stream.getvalue(), expected)
+
+    def test_read_new_lines(self):
+        """
+        Test that only complete lines after the offset are read.
+        """
+
+        self.append("level\nhello\nno")
+
+        lines, offset, in_long_line = read_new_lines(self.input_file, 0)
+        self.assertEqual((lines, offset, in_long_line), (["level", "hello"], 12, False))
+
+        self.append("on\n")
+        self.assertEqual(read_new_lines(self.input_file, offset), (["noon"], 17, False))
+        self.assertEqual(read_new_lines(self.input_file, 17), ([], 17, False))
+
+    def test_read_new_lines_skips_long_line(self):
+        """
+        Test that a line longer than the most bytes read at once is skipped.
+        """
+
+        self.append("x" * 25 + "\nlevel\n")
+
+        self.assertEqual(read_new_lines(self.input_file, 0, max_size=10), ([], 10, True))
+        self.assertEqual(read_new_lines(self.input_file, 10, max_size=10, skip_line=True), ([], 20, True))
+        self.assertEqual(read_new_lines(self.input_file, 20, max_size=10, skip_line=True), ([], 26, False))
+        self.assertEqual(read_new_lines(self.input_file, 26, max_size=10), (["level"], 32, False))
+
+    def test_save_and_load_state(self):
+        """
+        Test that the saved position is loaded back, and a broken state starts over.
+        """
+
+        self.assertEqual(load_state(self.state_file), (None, 0))
+
+        save_state(self.state_file, 42, 1234)
+        self.assertEqual(load_state(self.state_file), (42, 1234))
+
+        with open(self.state_file, "w") as tmp:
+            tmp.write("{broken")
+        self.assertEqual(load_state(self.state_file), (None, 0))
+
+    def test_file_watcher_polling(self):
+        """
+        Test that the polling watcher notices appended lines.
+        """
+
+        self.append("level\n")
+        watcher = FileWatcher(self.input_file, use_inotify=False)
+        self.addCleanup(watcher.close)
+
+        self.assertTrue(watcher.wait(0.1))
+        self.assertFalse(watcher.wait(0.1))
+
+        self.append("noon\n")
+        self.assertTrue(watcher.wait(1))
+
+    def test_follow_appended_lines(self):
+        """
+        Test that palindromes appended to the file are found, with and without inotify.
+        """
+
+        for use_inotify in (True, False):
+            with self.subTest(use_inotify=use_inotify):
+                self.append("level\nhello\n", mode="w")
+                if os.path.exists(self.state_file):
+                    os.remove(self.state_file)
+
+                stream, stop = self.start_follow(use_inotify)
+                self.wait_for_output(stream, "\tlevel\n")
+
+                self.append("noon\nwor")
+                self.wait_for_output(stream, "\tlevel\n\tnoon\n")
+
+                self.append("ld\nracecar\n")
+                self.wait_for_output(stream, "\tlevel\n\tnoon\n\tracecar\n")
+                stop()
+
+    def test_follow_skips_long_line(self):
+        """
+        Test that a line longer than the most bytes read at once doesn't stall the follow.
+        """
+
+        with mock.patch("palindrome_checker.follow_mode.MAX_READ_SIZE", 10):
+            self.append("x" * 25 + "\nlevel\n")
+            stream, _ = self.start_follow()
+            self.wait_for_output(stream, "\tlevel\n")
+
+    def test_follow_resumes_from_saved_position(self):
+        """
+        Test that a restarted follow only checks the lines added since the last run.
+        """
+
+        self.append("level\n")
+        stream, stop = self.start_follow()
+        self.wait_for_output(stream, "\tlevel\n")
+        stop()
+
+        self.append("civic\n")
+        stream, _ = self.start_follow()
+        self.wait_for_output(stream, "\tcivic\n")
+
+    def test_follow_truncated_file(self):
+        """
+        Test that a truncated file is checked again from the start.
+        """
+
+        self.append("hello\nworld\nlevel\n")
+        stream, _ = self.start_follow()
+        self.wait_for_output(stream, "\tlevel\n")
+
+        self.append("noon\n", mode="w")
+        self.wait_for_output(stream, "\tlevel\n\tnoon\n")
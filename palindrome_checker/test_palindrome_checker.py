@@ -2,10 +2,13 @@
 import unittest
 from   unittest import mock
 import tempfile
+import json
 import os
+import subprocess
+import sys
 
 # --- Import the functions to be tested
-from palindrome_checker.palindrome_checker import get_input_data, reverse_word_pairing, get_palindromes, main
+from palindrome_checker.checker import get_input_data, reverse_word_pairing, get_palindromes, main, parse_arguments, build_parser
 
 class TestPalindromeChecker(unittest.TestCase):
     """
@@ -81,4 +84,86 @@ class TestPalindromeChecker(unittest.TestCase):
             self.assertEqual(result, ["racecar", "level"])
 
         # Clean up the temporary file
-        os.remove(tmpfile_name)
\ No newline at end of file
+        os.remove(tmpfile_name)
+
+    def test_main_flow_jsonl_output(self):
+        """
+        Test that main writes the palindromes to the selected output file and format.
+        """
+        
+        # Create a temporary file with sample data
+        with tempfile.NamedTemporaryFile(mode="w+t", delete=False) as tmpfile:
+            tmpfile.write("racecar\nhello\nlevel\nworld\n")
+            tmpfile_name = tmpfile.name
+        output_name = tmpfile_name + ".jsonl"
+        
+        # Patch sys.argv to simulate command line input
+        with mock.patch("sys.argv", ["palindrome_checker.py", tmpfile_name, "--output-format", "jsonl", "-o", output_name]):
+            main()
+
+        with open(output_name) as output_file:
+            self.assertEqual(output_file.read(), '{"palindrome": "racecar"}\n{"palindrome": "level"}\n')
+
+        # Clean up the temporary files
+        os.remove(tmpfile_name)
+        os.remove(output_name)
+
+    def test_parse_arguments_fast_path(self):
+        """
+        Test that the options used without argparse match the parser defaults.
+        """
+
+        for argv in (["words.txt"], ["words.txt", "--count"], ["-c", "words.txt"], ["words.txt", "-f"], ["--follow", "words.txt"]):
+            with self.subTest(argv=argv), mock.patch("sys.argv", ["palindrome_checker.py", *argv]):
+                args = parse_arguments()
+
+                self.assertEqual(vars(args), vars(build_parser().parse_args(argv)))
+
+    def test_main_flow_metrics(self):
+        """
+        Test that main writes the items and time of every stage to the metrics file.
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w+t", delete=False) as tmpfile:
+            tmpfile.write("racecar\nhello\n\nlevel\n")
+            tmpfile_name = tmpfile.name
+        metrics_name = tmpfile_name + ".json"
+
+        with mock.patch("sys.argv", ["palindrome_checker.py", tmpfile_name, "--metrics-file", metrics_name]):
+            main(print_palindromes=False)
+
+        with open(metrics_name) as metrics_file:
+            snapshot = json.load(metrics_file)
+
+        items = {sample["labels"]["stage"]: sample["value"]
+                 for sample in snapshot["counters"]["palindrome_checker_stage_items_total"]}
+        self.assertEqual(items, {"read": 4, "normalize": 3, "check": 3})
+
+        stages = [sample["labels"]["stage"] for sample in snapshot["histograms"]["palindrome_checker_stage_seconds"]]
+        self.assertEqual(stages, ["check", "normalize", "read"])
+
+        # Clean up the temporary files
+        os.remove(tmpfile_name)
+        os.remove(metrics_name)
+
+    def test_script_ignores_installed_packages(self):
+        """
+        Test that the script uses the shared packages of the repository even when
+        installed packages with the same names come first on the path.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for package in ("output_writer", "metrics"):
+                os.mkdir(os.path.join(tmp_dir, package))
+                with open(os.path.join(tmp_dir, package, "__init__.py"), "w") as init_file:
+                    init_file.write("raise ImportError('installed package used')\n")
+
+            input_name = os.path.join(tmp_dir, "words.txt")
+            with open(input_name, "w") as input_file:
+                input_file.write("level\nhello\n")
+
+            script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "palindrome_checker.py")
+            result = subprocess.run([sys.executable, script, input_name], capture_output=True, text=True,
+                                    env={**os.environ, "PYTHONPATH": tmp_dir})
+
+        self.assertEqual((result.returncode, result.stdout), (0, "Found palindromes:\n\tlevel\n"), result.stderr)
@@ -0,0 +1,155 @@
+# --- Import required python libraries
+import unittest
+from   unittest import mock
+import tempfile
+import json
+import os
+
+# --- Import the functions to be tested
+from palindrome_checker.palindrome_counter import PalindromeCounter, SketchPalindromeCounter, BloomFilter, CountMinSketch, iter_word_chunks
+from palindrome_checker.checker import main
+
+class TestPalindromeCounter(unittest.TestCase):
+    """
+    Unit tests for the palindrome_counter module.
+    Tests exact and sketch counting of palindromes and the count mode of the script.
+    """
+
+    words = ["level", "hello", "level", "noon", "world", "level", "noon", "hello", "a"]
+
+    def test_exact_counter(self):
+        """
+        Test that the exact counter counts every occurrence of each palindrome.
+        """
+
+        counter = PalindromeCounter()
+        counter.add_words(self.words[:4])
+        counter.add_words(self.words[4:])
+
+        self.assertEqual(counter.most_common(), [("level", 3), ("noon", 2), ("a", 1)])
+        self.assertEqual(counter.most_common(1), [("level", 3)])
+        self.assertEqual(counter.distinct, 3)
+
+    def test_exact_counter_checks_each_word_once(self):
+        """
+        Test that words already checked are remembered, up to max_checked words.
+        """
+
+        counter = PalindromeCounter(max_checked=2)
+        counter.add_words(self.words)
+        counter.add_words(self.words)
+
+        self.assertEqual(len(counter._checked), 2)
+        self.assertEqual(counter.most_common(), [("level", 6), ("noon", 4), ("a", 2)])
+
+    def test_bloom_filter(self):
+        """
+        Test that the Bloom filter remembers the items added.
+        """
+
+        bloom = BloomFilter(1024, 3)
+
+        self.assertFalse(bloom.add(1, 7))
+        self.assertTrue(bloom.add(1, 7))
+
+    def test_count_min_sketch(self):
+        """
+        Test that the count-min sketch never underestimates.
+        """
+
+        sketch = CountMinSketch(16, 3)
+        for item in range(100):
+            sketch.add(item, 2 * item + 1, item)
+
+        for item in range(100):
+            with self.subTest(item=item):
+                self.assertGreaterEqual(sketch.add(item, 2 * item + 1, 0), item)
+
+    def test_sketch_counter(self):
+        """
+        Test that the sketch counter keeps the top K palindromes with their counts.
+        """
+
+        counter = SketchPalindromeCounter(memory_bytes=64 * 1024, top_k=2)
+        counter.add_words(self.words[:4])
+        counter.add_words(self.words[4:])
+
+        self.assertEqual(counter.most_common(), [("level", 3), ("noon", 2)])
+        self.assertEqual(counter.distinct, 3)
+
+    def test_iter_word_chunks(self):
+        """
+        Test that words are read in chunks of cleaned lines.
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w+t", delete=False) as tmpfile:
+            tmpfile.write(" level \nhello\n\nnoon\n")
+            tmpfile_name = tmpfile.name
+
+        self.assertEqual(list(iter_word_chunks(tmpfile_name, chunk_size=2)), [["level", "hello"], ["noon"]])
+
+        # Clean up the temporary file
+        os.remove(tmpfile_name)
+
+    def test_main_count_mode(self):
+        """
+        Test that main returns the counted palindromes in count mode.
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w+t", delete=False) as tmpfile:
+            tmpfile.write("\n".join(self.words))
+            tmpfile_name = tmpfile.name
+
+        for extra_args in ([], ["--sketch-memory", "1"]):
+            with self.subTest(extra_args=extra_args):
+                with mock.patch("sys.argv", ["palindrome_checker.py", tmpfile_name, "--count", "--top", "2", *extra_args]):
+                    result = main(print_palindromes=False)
+                    self.assertEqual(result, [("level", 3), ("noon", 2)])
+
+        # Clean up the temporary file
+        os.remove(tmpfile_name)
+
+    def test_main_count_mode_invalid_options(self):
+        """
+        Test that --top and --max-checked below 1 and a sketch memory too small for a
+        usable sketch are refused.
+        """
+
+        for extra_args in (["--top", "0"], ["--max-checked", "0"], ["--sketch-memory", "-1"],
+                           ["--sketch-memory", "0"], ["--sketch-memory", "0.01"]):
+            with self.subTest(extra_args=extra_args):
+                with mock.patch("sys.argv", ["palindrome_checker.py", "words.txt", "--count", *extra_args]), \
+                     mock.patch("sys.stderr"):
+                    with self.assertRaises(SystemExit):
+                        main(print_palindromes=False)
+
+        with self.assertRaises(ValueError):
+            SketchPalindromeCounter(1024)
+
+    def test_main_count_mode_metrics(self):
+        """
+        Test that count mode writes the items and time of every stage to the metrics file.
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w+t", delete=False) as tmpfile:
+            tmpfile.write("level\nhello\n\nlevel\n")
+            tmpfile_name = tmpfile.name
+        metrics_name = tmpfile_name + ".json"
+
+        with mock.patch("sys.argv", ["palindrome_checker.py", tmpfile_name, "--count", "--metrics-file", metrics_name]), \
+             mock.patch("sys.stdout"):
+            main()
+
+        with open(metrics_name) as metrics_file:
+            snapshot = json.load(metrics_file)
+
+        items = {sample["labels"]["stage"]: sample["value"]
+                 for sample in snapshot["counters"]["palindrome_checker_stage_items_total"]}
+        self.assertEqual(items, {"read": 4, "normalize": 3, "check": 3, "emit": 1})
+
+        stages = [sample["labels"]["stage"] for sample in snapshot["histograms"]["palindrome_checker_stage_seconds"]]
+        self.assertEqual(stages, ["check", "emit", "normalize", "read"])
+
+        # Clean up the temporary files
+        os.remove(tmpfile_name)
+        os.remove(metrics_name)
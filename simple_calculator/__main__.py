@@ -0,0 +1,16 @@
+"""
+Entry point for `python -m simple_calculator`.
+
+Usage:
+    python -m simple_calculator [options] [--startup-profile]
+"""
+
+import sys
+
+if "--startup-profile" in sys.argv[1:]:
+    from startup_profile.startup_profile import profile_startup
+    sys.exit(profile_startup("simple_calculator", sys.argv[1:]))
+
+from simple_calculator.simple_calculator import main
+
+main()
@@ -10,7 +10,25 @@ Keeps a history of calculations and handles invalid input gracefully.
 
 # Import required libraries
 from math import sqrt, pow, cbrt
-import inspect
+import os
+import sys
+from types import SimpleNamespace
+
+if not __package__:
+    # Run as a script: the shared packages live one level up. Put the repository root
+    # right after the script directory so installed packages can't shadow them
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if repo_root not in sys.path:
+        sys.path.insert(1, repo_root)
+
+from output_writer.output_writer import OUTPUT_DEFAULTS, OutputWriter, add_output_arguments, open_output
+from metrics.metrics import METRICS_DEFAULTS, NULL_METRICS, add_metrics_arguments, open_metrics
+
+# Metrics of the operations performed
+OPERATIONS_TOTAL = "simple_calculator_operations_total"
+OPERATION_ERRORS = "simple_calculator_operation_errors_total"
+INPUT_ERRORS = "simple_calculator_input_errors_total"
+OPERATION_SECONDS = "simple_calculator_operation_seconds"
 
 def add(a: float, b: float) -> float:
     """Return the sum of two numbers.
@@ -94,24 +112,66 @@ def cube_root(a: float) -> float:
     """    
     return cbrt(a)
 
-def show_history(history: list[str]) -> None:
+def show_history(history: list[str], output: OutputWriter | None = None) -> None:
     """Print on terminal all the operations performed so far.
 
     Args:
         history (list[str]): A list of operations and their results put together in strings
+        output (OutputWriter | None): Writer for the history, defaults to plain text on the terminal
     """    
 
+    if output is None:
+        output = OutputWriter()
+
     if history:
-        print("All operations performed so far:")
+        if output.output_format == "plain":
+            output.write("All operations performed so far:")
         
         for item in history:
-            print(f"\t{item}")
+            output.write({"operation": item}, text=f"\t{item}")
+
+    elif output.output_format == "plain":
+        output.write("No operations performed yet.")
+
+    output.flush()
+
+# Values of the options when they aren't given, the defaults of the shared options
+DEFAULT_OPTIONS = {**OUTPUT_DEFAULTS, **METRICS_DEFAULTS}
 
-    else:
-        print("No operations performed yet.")
+def build_parser():
+    """Build the command-line parser for the calculator.
+
+    Returns:
+        ArgumentParser: Parser for the operation history output and metrics settings.
+    """
+    import argparse
+    from startup_profile.startup_profile import add_startup_profile_argument
+
+    parser = argparse.ArgumentParser(description="Simple CLI Calculator")
+    add_output_arguments(parser)
+    add_metrics_arguments(parser)
+    add_startup_profile_argument(parser)
+    return parser
+
+def parse_arguments():
+    """Parse command-line arguments for the calculator.
+
+    Without arguments the default options are used without importing argparse.
+
+    Returns:
+        Namespace: Parsed arguments with the operation history output settings.
+    """
+    if len(sys.argv) == 1:
+        return SimpleNamespace(**DEFAULT_OPTIONS)
 
-def calculator() -> None:
+    return build_parser().parse_args()
+
+def calculator(output: OutputWriter | None = None, metrics=NULL_METRICS) -> None:
     """Execute the calculator script flow.
+
+    Args:
+        output (OutputWriter | None): Writer for the operation history, defaults to plain text on the terminal
+        metrics (Metrics | NullMetrics): Metrics for the count and latency of every operation, disabled by default
     """
     print("Welcome to the CLI Calculator script.")
     
@@ -151,6 +211,7 @@ def calculator() -> None:
 
         # Validate user input
         if user_input not in operation_map.keys():
+            metrics.inc(INPUT_ERRORS, input="choice")
             print(f"'{user_input}' is not a valid option, please try again.")
             continue
 
@@ -161,24 +222,33 @@ def calculator() -> None:
             continue # let this reach the next execution to test while loop definition
         
         if user_input == "8":
-            operation(operation_history)
+            operation(operation_history, output)
+            metrics.inc(OPERATIONS_TOTAL, operation=operation.__name__)
             continue
 
-        # Regular operation execution algorithm
+        # Regular operation execution algorithm, inspect is only needed from the first operation
+        import inspect
+
         try:
             args = [float(input(f"\nEnter number {i+1}: ")) for i in range(len(inspect.signature(operation).parameters))]
         except Exception as e:
+            metrics.inc(INPUT_ERRORS, input="number")
             print(f"\n\nError:\n\t{e}\n")
             input("Press enter to get back to operation selection")
             continue
 
-        # Calculate operation result
+        # Calculate operation result, counted once it ran whether it failed or not
         try:
-            result = operation(*args)
+            with metrics.timer(OPERATION_SECONDS, operation=operation.__name__):
+                result = operation(*args)
         except Exception as op_error:
+            metrics.inc(OPERATIONS_TOTAL, operation=operation.__name__)
+            metrics.inc(OPERATION_ERRORS, operation=operation.__name__)
             print(f"Error executing operation:\n\t{op_error}")
             continue
 
+        metrics.inc(OPERATIONS_TOTAL, operation=operation.__name__)
+
         # Print the adequate msg depending on the operation performed
         match user_input:
             case "1":
@@ -208,6 +278,31 @@ def calculator() -> None:
         operation_history.append(msg)
 
 
+def main() -> None:
+    """Parse the command-line arguments and run the calculator.
+    """
+    args = parse_arguments()
+
+    try:
+        output = open_output(args)
+    except OSError as e:
+        print(f"Error opening output file:\n\t{e}")
+        sys.exit(1)
+
+    try:
+        metrics = open_metrics(args)
+    except OSError as e:
+        print(f"Error starting the metrics:\n\t{e}")
+        sys.exit(1)
+
+    with output, metrics:
+        calculator(output, metrics)
+
+
 if __name__ == "__main__":
 
-    calculator()
\ No newline at end of file
+    if "--startup-profile" in sys.argv[1:]:
+        from startup_profile.startup_profile import profile_startup
+        sys.exit(profile_startup("simple_calculator", sys.argv[1:], script=__file__))
+
+    main()
@@ -1,7 +1,9 @@
 # Import the unittest module
 import unittest
 # Import the functions to be tested
-from simple_calculator.simple_calculator import add, subtract, multiply, divide, power, square_root, cube_root, show_history
+from simple_calculator.simple_calculator import add, subtract, multiply, divide, power, square_root, cube_root, show_history, parse_arguments, build_parser, calculator
+from output_writer.output_writer import OutputWriter
+from metrics.collector import Metrics
 
 
 class TestSimpleCalculator(unittest.TestCase):
@@ -122,4 +124,45 @@ class TestSimpleCalculator(unittest.TestCase):
                 show_history(history)
                 sys.stdout = sys.__stdout__
                 self.assertEqual(captured_output.getvalue().strip(), expected)
-    
\ No newline at end of file
+    
+
+    def test_show_history_jsonl_output(self):
+        """Test the show_history function with JSONL output"""
+        from io import StringIO
+
+        captured_output = StringIO()
+        show_history(["1.0 + 2.0 = 3.0", "sqrt(4.0) = 2.0"], OutputWriter(captured_output, "jsonl"))
+        self.assertEqual(captured_output.getvalue(),
+                         '{"operation": "1.0 + 2.0 = 3.0"}\n{"operation": "sqrt(4.0) = 2.0"}\n')
+
+    def test_parse_arguments_fast_path(self):
+        """Test that the options used without argparse match the parser defaults"""
+        from unittest.mock import patch
+
+        with patch("sys.argv", ["simple_calculator.py"]):
+            args = parse_arguments()
+
+        self.assertEqual(vars(args), vars(build_parser().parse_args([])))
+
+    def test_calculator_metrics(self):
+        """Test that operations are counted once they ran, and input errors are counted too"""
+        from io import StringIO
+        from unittest.mock import patch
+
+        # Invalid choice, invalid number, 1 + 2, 1 / 0, history, exit
+        answers = iter(["9", "1", "x", "", "1", "1", "2", "4", "1", "0", "8", "0"])
+        metrics = Metrics()
+
+        with patch("builtins.input", lambda prompt="": next(answers)), patch("sys.stdout", StringIO()):
+            calculator(OutputWriter(StringIO()), metrics)
+
+        counters = {(name, tuple(sample["labels"].values())): sample["value"]
+                    for name, series in metrics.snapshot()["counters"].items() for sample in series}
+        self.assertEqual(counters, {
+            ("simple_calculator_input_errors_total", ("choice",)): 1,
+            ("simple_calculator_input_errors_total", ("number",)): 1,
+            ("simple_calculator_operations_total", ("add",)): 1,
+            ("simple_calculator_operations_total", ("divide",)): 1,
+            ("simple_calculator_operations_total", ("show_history",)): 1,
+            ("simple_calculator_operation_errors_total", ("divide",)): 1,
+        })
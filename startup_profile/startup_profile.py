@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+"""
+Startup Profile
+---------------
+Measures how long the tools take to start, for the --startup-profile flag of their
+scripts and `python -m <tool>` entry points.
+
+The tool is run again in a child interpreter with `-X importtime`. Its output is
+passed through unchanged, and a report with the time to the first output, the total
+time and the slowest imports is written to stderr once it finishes.
+
+The entry points check for the flag themselves and only import this module when
+profiling, or when they build their parser to list the flag in the help. The
+startups that skip argparse don't load it.
+
+Usage:
+    python -m palindrome_checker sample.txt --startup-profile
+    python palindrome_checker.py sample.txt --startup-profile
+"""
+
+# --- Import python libraries
+
+import sys
+
+# --- Useful global variables
+
+STARTUP_PROFILE_FLAG = "--startup-profile"
+
+# --- Method definitions
+
+def add_startup_profile_argument(parser) -> None:
+    """
+    List the --startup-profile flag in the help of a tool.
+
+    The entry points handle the flag before parsing, so it never shows up in the
+    parsed arguments.
+
+    Args:
+        parser (ArgumentParser): Parser to add the flag to.
+    """
+    from argparse import SUPPRESS
+
+    parser.add_argument(
+        STARTUP_PROFILE_FLAG,
+        action="store_true",
+        default=SUPPRESS,
+        help="Run the tool, then report its startup time and slowest imports on stderr"
+    )
+
+def parse_importtime(lines: list[str]) -> list[tuple[str, int, int, int]]:
+    """
+    Parse the report written to stderr by `python -X importtime`.
+
+    Args:
+        lines (list[str]): Lines written to stderr, other lines are ignored.
+
+    Returns:
+        list: (module, self time in us, cumulative time in us, nesting depth) per import
+    """
+    imports = []
+
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+
+    return imports
+
+def format_report(module: str, first_output: float | None, total: float,
+                  imports: list[tuple[str, int, int, int]], top: int = 10) -> str:
+    """
+    Format the startup profile report.
+
+    Args:
+        module (str): Profiled module.
+        first_output (float | None): Seconds until the first output, None if there was none.
+        total (float): Seconds until the tool finished.
+        imports (list): Imports as returned by parse_importtime.
+        top (int): Amount of slowest top-level imports to list (default: 10).
+
+    Returns:
+        str: The report.
+    """
+    lines = [f"Startup profile for {module}:"]
+
+    if first_output is not None:
+        lines.append(f"\tfirst output after {first_output * 1000:.1f} ms")
+    lines.append(f"\tfinished after {total * 1000:.1f} ms")
+    lines.append(f"\timports: {sum(imported[1] for imported in imports) / 1000:.1f} ms "
+                 f"in {len(imports)} modules")
+
+    top_level = sorted((imported for imported in imports if imported[3] == 0),
+                       key=lambda imported: imported[2], reverse=True)[:top]
+    if top_level:
+        lines.append("\tslowest imports (cumulative):")
+        for name, _, cumulative, _ in top_level:
+            lines.append(f"\t\t{cumulative / 1000:>7.1f} ms  {name}")
+
+    return "\n".join(lines) + "\n"
+
+def profile_startup(module: str, args: list[str], top: int = 10, script: str | None = None) -> int:
+    """
+    Run a tool module in a child interpreter and report its startup cost on stderr.
+
+    Args:
+        module (str): Module to run with `python -m`.
+        args (list[str]): Command-line arguments for the module, --startup-profile is removed.
+        top (int): Amount of slowest top-level imports to list (default: 10).
+        script (str | None): Script to run instead of the module, to profile the script start.
+
+    Returns:
+        int: Exit code of the tool.
+    """
+    import subprocess
+    import tempfile
+    import time
+
+    args = [arg for arg in args if arg != STARTUP_PROFILE_FLAG]
+    target = [script] if script else ["-m", module]
+    command = [sys.executable, "-X", "importtime", *target, *args]
+    first_output = None
+
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr)
+
+        # Pass the output through as it arrives, timing the first piece
+        while chunk := process.stdout.read1():
+            if first_output is None:
+                first_output = time.perf_counter() - start
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+
+        exit_code = process.wait()
+        total = time.perf_counter() - start
+
+        stderr.seek(0)
+        lines = stderr.read().decode(errors="replace").splitlines()
+
+    # Keep the tool's own errors visible
+    for line in lines:
+        if not line.startswith("import time:"):
+            print(line, file=sys.stderr)
+
+    sys.stderr.write(format_report(module, first_output, total, parse_importtime(lines), top))
+    return exit_code
@@ -0,0 +1,91 @@
+# --- Import required python libraries
+import unittest
+from   unittest import mock
+import tempfile
+import io
+import os
+import subprocess
+import sys
+
+# --- Import the functions to be tested
+from startup_profile.startup_profile import parse_importtime, format_report, profile_startup
+from palindrome_checker.checker import build_parser
+
+class TestStartupProfile(unittest.TestCase):
+    """
+    Unit tests for the startup_profile module functions.
+    Tests parsing the import times, the report and profiling a tool.
+    """
+
+    importtime_lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   _io",
+        "import time:       300 |        420 | io",
+        "import time:      1500 |       1500 | argparse",
+        "Error reading input file:",
+    ]
+
+    def test_parse_importtime(self):
+        """
+        Test that the import times are parsed with their nesting, skipping other lines.
+        """
+
+        self.assertEqual(parse_importtime(self.importtime_lines),
+                         [("_io", 120, 120, 1), ("io", 300, 420, 0), ("argparse", 1500, 1500, 0)])
+
+    def test_format_report(self):
+        """
+        Test that the report lists the slowest top-level imports first.
+        """
+
+        report = format_report("tool", 0.0123, 0.0456, parse_importtime(self.importtime_lines), top=1)
+
+        self.assertEqual(report, "Startup profile for tool:\n"
+                                 "\tfirst output after 12.3 ms\n"
+                                 "\tfinished after 45.6 ms\n"
+                                 "\timports: 1.9 ms in 3 modules\n"
+                                 "\tslowest imports (cumulative):\n"
+                                 "\t\t    1.5 ms  argparse\n")
+
+    def test_profile_startup(self):
+        """
+        Test that the profiled tool output is passed through and the report is written to stderr.
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w+t", delete=False) as tmpfile:
+            tmpfile.write("level\nhello\n")
+            tmpfile_name = tmpfile.name
+
+        stdout = io.TextIOWrapper(io.BytesIO())
+        stderr = io.StringIO()
+        with mock.patch("sys.stdout", stdout), mock.patch("sys.stderr", stderr):
+            exit_code = profile_startup("palindrome_checker", [tmpfile_name, "--startup-profile"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stdout.buffer.getvalue(), b"Found palindromes:\n\tlevel\n")
+        self.assertIn("Startup profile for palindrome_checker:", stderr.getvalue())
+        self.assertIn("first output after", stderr.getvalue())
+
+        # Clean up the temporary file
+        os.remove(tmpfile_name)
+
+    def test_profile_startup_script(self):
+        """
+        Test that the scripts accept --startup-profile and list it in their help.
+        """
+
+        with tempfile.NamedTemporaryFile(mode="w+t", delete=False) as tmpfile:
+            tmpfile.write("level\nhello\n")
+            tmpfile_name = tmpfile.name
+
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = os.path.join(repo_root, "palindrome_checker", "palindrome_checker.py")
+        result = subprocess.run([sys.executable, script, tmpfile_name, "--startup-profile"],
+                                capture_output=True, text=True)
+
+        self.assertEqual((result.returncode, result.stdout), (0, "Found palindromes:\n\tlevel\n"), result.stderr)
+        self.assertIn("Startup profile for palindrome_checker:", result.stderr)
+        self.assertIn("--startup-profile", build_parser().format_help())
+
+        # Clean up the temporary file
+        os.remove(tmpfile_name)